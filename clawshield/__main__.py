@@ -4,26 +4,38 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 from pathlib import Path
 
+try:  # Optional accelerator; stdlib json is the fallback.
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 from . import __version__
-from .core.engine import EvalResult, PolicyEngine, PolicyLoadError
-from .runtimes.openclaw.adapter import OpenClawAdapter
-from .scanners.docker import DockerScanner
-from .scanners.openclaw.config import OpenClawConfigScanner
-from .scanners.openclaw.permissions import FilePermissionsScanner
-from .scanners.openclaw.secrets import SecretsLiteScanner
 
 _SEVERITY_RANK = {"low": 0, "medium": 1, "high": 2, "critical": 3}
 
 
+def _dumps(obj: dict) -> str:
+    """Serialize the output document to indented JSON.
+
+    default=str stays in both paths: fact values come from YAML and can
+    include non-JSON types such as dates.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode()
+    return json.dumps(obj, indent=2, default=str)
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         prog="clawshield",
         description="Security audit for OpenClaw deployments",
     )
     parser.add_argument("config", nargs="?", help="Path to OpenClaw config file")
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
     parser.add_argument("--json", action="store_true", dest="json_output", help="Output findings as JSON")
     parser.add_argument("--policy", type=Path, help="Path to custom policy YAML")
     parser.add_argument(
@@ -34,6 +46,15 @@ def main() -> int:
     )
     args = parser.parse_args()
 
+    # Deferred so that --help/--version don't pay for PyYAML and the
+    # scanner imports.
+    from .core.engine import PolicyEngine, PolicyLoadError
+    from .runtimes.openclaw.adapter import OpenClawAdapter
+    from .scanners.docker import DockerScanner
+    from .scanners.openclaw.config import OpenClawConfigScanner
+    from .scanners.openclaw.permissions import FilePermissionsScanner
+    from .scanners.openclaw.secrets import SecretsLiteScanner
+
     config_path = Path(args.config) if args.config else None
     policy_path = args.policy or Path(__file__).resolve().parent / "policies" / "vps_public.yaml"
 
@@ -52,25 +73,31 @@ def main() -> int:
             print("  This may indicate a broken installation. Try: pip install --force-reinstall clawshield", file=sys.stderr)
         return 1
     try:
-        engine = PolicyEngine(policy_path)
+        # The bundled policy is validated in CI; skip re-validating it on
+        # every run. Custom --policy files still get the full checks.
+        engine = PolicyEngine(policy_path, trusted=args.policy is None)
     except PolicyLoadError as e:
         print(f"error: {e}", file=sys.stderr)
         return 1
 
-    # Collect facts from all scanners
+    # Collect facts from all scanners. The scanners are independent, so run
+    # them concurrently: the Docker subprocess calls overlap with the config
+    # file I/O. Results are gathered in a fixed order to keep fact ordering
+    # (and thus output) deterministic.
     warnings: list[str] = []
+    config_paths = adapter.get_config_paths()
 
-    config_scanner = OpenClawConfigScanner()
-    facts = config_scanner.scan(adapter.get_config_paths())
-
-    secrets_scanner = SecretsLiteScanner()
-    facts.extend(secrets_scanner.scan(adapter.get_config_paths()))
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        config_future = pool.submit(OpenClawConfigScanner().scan, config_paths)
+        secrets_future = pool.submit(SecretsLiteScanner().scan, config_paths)
+        permissions_future = pool.submit(FilePermissionsScanner().scan, config_paths)
+        docker_future = pool.submit(DockerScanner().scan)
 
-    permissions_scanner = FilePermissionsScanner()
-    facts.extend(permissions_scanner.scan(adapter.get_config_paths()))
+    facts = config_future.result()
+    facts.extend(secrets_future.result())
+    facts.extend(permissions_future.result())
 
-    docker_scanner = DockerScanner()
-    docker_facts, docker_warnings = docker_scanner.scan()
+    docker_facts, docker_warnings = docker_future.result()
     facts.extend(docker_facts)
     warnings.extend(docker_warnings)
 
@@ -85,7 +112,7 @@ def main() -> int:
                 "findings": [],
                 "facts": [],
             }
-            print(json.dumps(empty, indent=2, default=str))
+            print(_dumps(empty))
         else:
             print("No facts collected from configuration.")
         return 0
@@ -109,7 +136,7 @@ def main() -> int:
             "facts": [asdict(f) for f in facts],
             "findings": [asdict(f) for f in findings],
         }
-        print(json.dumps(output, indent=2, default=str))
+        print(_dumps(output))
     elif not findings:
         print("Audit complete. No issues found for the checks performed.")
     else:
@@ -1,8 +1,33 @@
 from __future__ import annotations
 
-from typing import Any
+import operator
+from typing import Any, Callable
 
-_VALID_OPS = {"eq", "in"}
+_VALID_OPS = frozenset({"eq", "in"})
+
+def _op_in(actual: Any, expected: Any) -> bool:
+    """Membership test tolerating unhashable fact values.
+
+    The engine freezes 'in' values to frozensets, and an unhashable
+    actual (e.g. a list straight out of YAML) raises TypeError against
+    those. Such a value could never equal a hashable member, so treat
+    it as not contained — matching list membership semantics.
+    """
+    try:
+        return actual in expected
+    except TypeError:
+        return False
+
+
+# Operator dispatch: name -> callable(actual, expected). Resolved once at
+# import time instead of via an if/elif chain on every leaf evaluation.
+_OP_FUNCS = {
+    "eq": operator.eq,
+    "in": _op_in,
+}
+
+# Sentinel distinguishing "fact missing" from "fact explicitly None".
+_MISSING = object()
 
 
 class PolicyValidationError(Exception):
@@ -48,28 +73,83 @@ def _validate_node(node: dict, errors: list[str], path: str) -> None:
                 errors.append(f"{path}: 'in' operator requires a list value, got {type(val).__name__}")
 
 
+def compile_condition(condition: dict) -> Callable[[dict[str, Any]], bool]:
+    """Compile a condition tree into a predicate over a flat fact map.
+
+    Fact keys, operator callables and expected values are bound into
+    closures once, so each evaluation is straight calls with no tree
+    walking or operator dispatch. The missing-fact contract matches
+    evaluate_condition: a leaf whose fact is absent evaluates to False.
+    """
+    if "all" in condition:
+        children = tuple(compile_condition(c) for c in condition["all"])
+
+        def _eval_all(facts: dict[str, Any]) -> bool:
+            for child in children:
+                if not child(facts):
+                    return False
+            return True
+
+        return _eval_all
+
+    if "any" in condition:
+        children = tuple(compile_condition(c) for c in condition["any"])
+
+        def _eval_any(facts: dict[str, Any]) -> bool:
+            for child in children:
+                if child(facts):
+                    return True
+            return False
+
+        return _eval_any
+
+    key = condition["fact"]
+    expected = condition["value"]
+    op_func = _OP_FUNCS.get(condition["op"])
+    if op_func is None:
+        # Unvalidated (trusted) policies may carry a bad operator; keep
+        # the error at evaluation time, as interpretation did.
+        op_name = condition["op"]
+
+        def _eval_bad_op(facts: dict[str, Any]) -> bool:
+            raise ValueError(f"Unknown operator: {op_name}")
+
+        return _eval_bad_op
+
+    def _eval_leaf(facts: dict[str, Any]) -> bool:
+        actual = facts.get(key, _MISSING)
+        return actual is not _MISSING and bool(op_func(actual, expected))
+
+    return _eval_leaf
+
+
 def evaluate_condition(condition: dict, facts: dict[str, Any]) -> bool:
     """Evaluate an all/any condition tree against a flat fact map.
 
     Missing facts cause the leaf condition to evaluate to False.
     """
     if "all" in condition:
-        return all(evaluate_condition(c, facts) for c in condition["all"])
+        for c in condition["all"]:
+            if not evaluate_condition(c, facts):
+                return False
+        return True
     if "any" in condition:
-        return any(evaluate_condition(c, facts) for c in condition["any"])
+        for c in condition["any"]:
+            if evaluate_condition(c, facts):
+                return True
+        return False
 
-    fact_key = condition["fact"]
-    op = condition["op"]
-    expected = condition["value"]
-    actual = facts.get(fact_key)
+    return _evaluate_leaf(condition, facts)
 
+
+def _evaluate_leaf(condition: dict, facts: dict[str, Any]) -> bool:
     # Explicit contract: missing fact → False
-    if actual is None and fact_key not in facts:
+    actual = facts.get(condition["fact"], _MISSING)
+    if actual is _MISSING:
         return False
 
-    if op == "eq":
-        return actual == expected
-    if op == "in":
-        return actual in expected
-
-    raise ValueError(f"Unknown operator: {op}")
+    op = condition["op"]
+    op_func = _OP_FUNCS.get(op)
+    if op_func is None:
+        raise ValueError(f"Unknown operator: {op}")
+    return bool(op_func(actual, condition["value"]))
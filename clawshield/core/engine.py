@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
+from typing import Any, Callable
 
 import yaml
 
-from .condition import evaluate_condition, validate_condition
+from .condition import compile_condition, validate_condition
 from .models import Fact, Finding
 
 _REQUIRED_RULE_KEYS = {"id", "title", "severity", "confidence", "condition"}
 
+# Prefer libyaml's C loader when available; behaves identically to SafeLoader.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class EvalResult:
@@ -17,17 +22,63 @@ class EvalResult:
     findings: list[Finding]
     warnings: list[str] = field(default_factory=list)
 
+    @cached_property
+    def rule_ids(self) -> frozenset[str]:
+        """IDs of the rules that fired, for cheap membership checks."""
+        return frozenset(f.rule_id for f in self.findings)
+
+
+@dataclass(slots=True)
+class _CompiledRule:
+    """A policy rule with load-time-derivable data precomputed.
+
+    Avoids re-walking the condition tree and re-parsing the actions
+    mapping on every evaluate() call.
+    """
+    id: str
+    title: str
+    severity: str
+    confidence: str
+    predicate: Callable[[dict[str, Any]], bool]
+    fact_keys: frozenset[str]
+    recommended: tuple[str, ...]
+    has_autofix: bool
+
 
 class PolicyLoadError(Exception):
     """Raised when a policy file is malformed."""
 
 
+# Compiled policies shared across engine instances, keyed by resolved
+# path + mtime so edits invalidate naturally. Entries are only written
+# by validated loads: serving a cached validated policy to a trusted
+# load is fine, but the reverse would let an unvalidated policy skip
+# its checks. The compiled artifacts are immutable once built.
+_COMPILED_CACHE: dict[tuple[str, int], tuple[list[_CompiledRule], dict[str, list[int]], list[int]]] = {}
+
+
 class PolicyEngine:
     """Loads YAML policy rules and evaluates them against collected facts."""
 
-    def __init__(self, policy_path: Path) -> None:
+    def __init__(self, policy_path: Path, trusted: bool = False) -> None:
+        """Load and compile a policy file.
+
+        trusted=True skips per-rule validation; reserve it for policies
+        shipped with the package, which are validated by the test suite.
+        """
+        cache_key: tuple[str, int] | None = None
+        try:
+            cache_key = (str(policy_path.resolve()), policy_path.stat().st_mtime_ns)
+        except OSError:
+            pass  # let open() below produce the real error
+        if cache_key is not None:
+            cached = _COMPILED_CACHE.get(cache_key)
+            if cached is not None:
+                self._rules, self._rule_indices_by_fact, self._keyless_rule_indices = cached
+                return
+
         with open(policy_path) as f:
-            policy = yaml.safe_load(f)
+            policy = yaml.load(f, Loader=_YamlLoader)
 
         if not isinstance(policy, dict):
             raise PolicyLoadError(f"{policy_path}: expected a YAML mapping at top level")
@@ -36,72 +87,160 @@ class PolicyEngine:
         if not isinstance(rules, list):
             raise PolicyLoadError(f"{policy_path}: 'rules' must be a list")
 
-        errors = _validate_rules(rules)
-        if errors:
-            joined = "\n  ".join(errors)
-            raise PolicyLoadError(f"{policy_path}: policy validation failed:\n  {joined}")
+        if not trusted:
+            errors = _validate_rules(rules)
+            if errors:
+                joined = "\n  ".join(errors)
+                raise PolicyLoadError(f"{policy_path}: policy validation failed:\n  {joined}")
+
+        self._rules: list[_CompiledRule] = [_compile_rule(rule) for rule in rules]
 
-        self._rules: list[dict] = rules
+        # Dispatch index: fact key -> positions of rules referencing it.
+        # evaluate() only visits rules that mention at least one collected
+        # fact. Skipping a rule is only safe if it cannot fire with none
+        # of its facts present — an empty 'all' composite nested beside a
+        # leaf makes a rule true on an empty fact map even though it
+        # references facts. So any rule whose predicate holds on {} goes
+        # on the always-visited list (which subsumes keyless rules).
+        self._rule_indices_by_fact: dict[str, list[int]] = {}
+        self._keyless_rule_indices: list[int] = []
+        for i, compiled in enumerate(self._rules):
+            if not compiled.fact_keys or _fires_without_facts(compiled.predicate):
+                self._keyless_rule_indices.append(i)
+                continue
+            for key in compiled.fact_keys:
+                self._rule_indices_by_fact.setdefault(key, []).append(i)
+
+        if cache_key is not None and not trusted:
+            _COMPILED_CACHE[cache_key] = (
+                self._rules, self._rule_indices_by_fact, self._keyless_rule_indices,
+            )
 
     def evaluate(self, facts: list[Fact]) -> EvalResult:
         fact_map, collisions = _build_fact_map(facts)
-        warnings: list[str] = []
-        if collisions:
-            for key, sources in collisions.items():
-                warnings.append(
-                    f"fact '{key}' collected {len(sources)} times "
-                    f"(sources: {', '.join(sources)}), using last value"
-                )
+        warnings = [
+            f"fact '{key}' collected {len(sources)} times "
+            f"(sources: {', '.join(sources)}), using last value"
+            for key, sources in collisions.items()
+        ]
 
         findings: list[Finding] = []
 
-        for rule in self._rules:
-            fact_keys = _extract_fact_keys(rule["condition"])
+        # Index facts by key once so evidence collection per firing rule is
+        # a hash lookup rather than a scan of the whole fact list.
+        facts_by_key: dict[str, list[Fact]] = {}
+        for f in facts:
+            facts_by_key.setdefault(f.key, []).append(f)
+
+        # Select candidate rules via the fact-key index; sorting the
+        # positions preserves policy order in the findings.
+        candidates: set[int] = set(self._keyless_rule_indices)
+        for key in facts_by_key:
+            candidates.update(self._rule_indices_by_fact.get(key, ()))
 
-            if evaluate_condition(rule["condition"], fact_map):
-                actions = rule.get("actions", {})
-                recommended = [a["id"] for a in actions.get("recommended", [])]
-                has_autofix = len(actions.get("autofix", [])) > 0
-                triggered = [f for f in facts if f.key in fact_keys]
+        for i in sorted(candidates):
+            rule = self._rules[i]
+            if rule.predicate(fact_map):
+                triggered = [
+                    f for key in sorted(rule.fact_keys)
+                    for f in facts_by_key.get(key, ())
+                ]
 
                 findings.append(Finding(
-                    rule_id=rule["id"],
-                    title=rule["title"],
-                    severity=rule["severity"],
-                    confidence=rule["confidence"],
+                    rule_id=rule.id,
+                    title=rule.title,
+                    severity=rule.severity,
+                    confidence=rule.confidence,
                     evidence=triggered,
-                    recommended_actions=recommended,
-                    autofix_available=has_autofix,
+                    recommended_actions=list(rule.recommended),
+                    autofix_available=rule.has_autofix,
                 ))
 
         return EvalResult(findings=findings, warnings=warnings)
 
 
+def _freeze_in_values(condition: dict) -> None:
+    """Convert list values of 'in' leaves to frozensets, in place.
+
+    Turns the per-evaluation linear membership scan into a hash lookup.
+    Values with unhashable elements are left as-is.
+    """
+    stack = [condition]
+    while stack:
+        node = stack.pop()
+        if "all" in node:
+            stack.extend(node["all"])
+        elif "any" in node:
+            stack.extend(node["any"])
+        elif node.get("op") == "in":
+            try:
+                node["value"] = frozenset(node["value"])
+            except TypeError:
+                pass
+
+
+def _compile_rule(rule: dict) -> _CompiledRule:
+    """Precompute the parts of a validated rule that evaluate() needs."""
+    _freeze_in_values(rule["condition"])
+    actions = rule.get("actions", {})
+    return _CompiledRule(
+        id=rule["id"],
+        title=rule["title"],
+        severity=rule["severity"],
+        confidence=rule["confidence"],
+        predicate=compile_condition(rule["condition"]),
+        fact_keys=frozenset(_extract_fact_keys(rule["condition"])),
+        recommended=tuple(a["id"] for a in actions.get("recommended", [])),
+        has_autofix=len(actions.get("autofix", [])) > 0,
+    )
+
+
+def _fires_without_facts(predicate: Callable[[dict[str, Any]], bool]) -> bool:
+    """True if a compiled predicate holds on an empty fact map.
+
+    An unknown operator in a trusted (unvalidated) policy raises at
+    evaluation time; treat that as not firing so the load still succeeds.
+    """
+    try:
+        return predicate({})
+    except ValueError:
+        return False
+
+
 def _build_fact_map(facts: list[Fact]) -> tuple[dict, dict[str, list[str]]]:
     """Build a flat fact map. Return (map, collisions).
 
     collisions maps duplicate keys to their list of sources.
     """
-    fact_map: dict = {}
+    fact_map: dict = {f.key: f.value for f in facts}
+
+    # Common case: no duplicate keys, so skip source tracking entirely.
+    if len(fact_map) == len(facts):
+        return fact_map, {}
+
     sources: dict[str, list[str]] = {}
     for f in facts:
         sources.setdefault(f.key, []).append(f.source)
-        fact_map[f.key] = f.value
     collisions = {k: v for k, v in sources.items() if len(v) > 1}
     return fact_map, collisions
 
 
 def _extract_fact_keys(condition: dict) -> set[str]:
-    """Walk a condition tree and collect all referenced fact keys."""
+    """Walk a condition tree and collect all referenced fact keys.
+
+    Uses an explicit stack rather than recursion: no intermediate set
+    per node, and no recursion limit on deeply nested policies.
+    """
     keys: set[str] = set()
-    if "all" in condition:
-        for c in condition["all"]:
-            keys |= _extract_fact_keys(c)
-    elif "any" in condition:
-        for c in condition["any"]:
-            keys |= _extract_fact_keys(c)
-    elif "fact" in condition:
-        keys.add(condition["fact"])
+    stack = [condition]
+    while stack:
+        node = stack.pop()
+        if "all" in node:
+            stack.extend(node["all"])
+        elif "any" in node:
+            stack.extend(node["any"])
+        elif "fact" in node:
+            keys.add(node["fact"])
     return keys
 
 
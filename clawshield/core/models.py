@@ -1,17 +1,25 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Fact:
     key: str
     value: Any
     source: str
 
+    def __post_init__(self) -> None:
+        # Fact keys (and usually sources) repeat heavily across scanners;
+        # interning deduplicates them and lets dict lookups use the
+        # identity fast path.
+        self.key = sys.intern(self.key)
+        self.source = sys.intern(self.source)
 
-@dataclass
+
+@dataclass(slots=True)
 class Finding:
     rule_id: str
     title: str
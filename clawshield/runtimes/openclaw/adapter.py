@@ -16,6 +16,8 @@ class OpenClawAdapter:
 
     def __init__(self, config_path: Path | None = None) -> None:
         self._explicit_path = config_path
+        self._resolved: Path | None = None
+        self._resolve_attempted = False
 
     def detect(self) -> bool:
         return self._resolve_config() is not None
@@ -36,17 +38,27 @@ class OpenClawAdapter:
         return locations
 
     def _resolve_config(self) -> Path | None:
-        if self._explicit_path and self._explicit_path.exists():
+        # Resolution hits the filesystem for every candidate path; do it
+        # once per adapter and reuse the answer for detect()/get_config_paths().
+        if not self._resolve_attempted:
+            self._resolved = self._search_config()
+            self._resolve_attempted = True
+        return self._resolved
+
+    def _search_config(self) -> Path | None:
+        # is_file() answers in a single stat() and also rejects directories,
+        # which exists() would have accepted.
+        if self._explicit_path and self._explicit_path.is_file():
             return self._explicit_path
 
         env_path = os.environ.get("OPENCLAW_CONFIG")
         if env_path:
             p = Path(env_path)
-            if p.exists():
+            if p.is_file():
                 return p
 
         for p in _SEARCH_PATHS:
-            if p.exists():
+            if p.is_file():
                 return p
 
         return None
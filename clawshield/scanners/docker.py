@@ -1,11 +1,24 @@
 from __future__ import annotations
 
+import functools
 import json
 import subprocess
 
+try:  # Optional accelerator; stdlib json is the fallback.
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 from ..core.models import Fact
 
 
+def _loads_json(data: str | bytes):
+    """Parse JSON with orjson when installed, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class DockerScanner:
     """Inspects running Docker containers for security-relevant facts.
 
@@ -13,6 +26,7 @@ class DockerScanner:
     rather than raising an error.
     """
 
+    __slots__ = ()
     name = "docker"
 
     def scan(self) -> tuple[list[Fact], list[str]]:
@@ -45,54 +59,72 @@ def parse_inspect_output(containers: list[dict]) -> list[Fact]:
     if not containers:
         return []
 
+    # Only _SOURCE_NAME_LIMIT names ever appear in the source string, so
+    # collect at most that many per bucket and count the rest: memory
+    # stays O(limit) no matter how many containers the host runs.
     root_names: list[str] = []
     privileged_names: list[str] = []
     all_names: list[str] = []
+    root_total = privileged_total = 0
 
     for container in containers:
         cid = container.get("Id") or "unknown"
-        name = container.get("Name") or cid[:12]
-        name = name.lstrip("/")
-        all_names.append(name)
+        name = (container.get("Name") or cid[:12]).lstrip("/")
+        if len(all_names) < _SOURCE_NAME_LIMIT:
+            all_names.append(name)
 
-        user = container.get("Config", {}).get("User", "")
-        privileged = container.get("HostConfig", {}).get("Privileged", False)
+        user = (container.get("Config") or {}).get("User", "")
+        privileged = (container.get("HostConfig") or {}).get("Privileged", False)
 
-        # Empty user, "root", or UID 0 all mean running as root
-        if not user or user == "root" or user.split(":")[0] == "0":
-            root_names.append(name)
+        if _is_root_user(user):
+            root_total += 1
+            if len(root_names) < _SOURCE_NAME_LIMIT:
+                root_names.append(name)
 
         if privileged:
-            privileged_names.append(name)
+            privileged_total += 1
+            if len(privileged_names) < _SOURCE_NAME_LIMIT:
+                privileged_names.append(name)
 
     facts: list[Fact] = []
 
-    is_root = bool(root_names)
+    is_root = root_total > 0
+    root_src = _cap_names(root_names, root_total) if is_root else _cap_names(all_names, len(containers))
     facts.append(Fact(
-        key="docker.user",
-        value="root" if is_root else "non-root",
-        source=f"docker_inspect:{_cap_names(root_names if is_root else all_names)}",
+        "docker.user",
+        "root" if is_root else "non-root",
+        f"docker_inspect:{root_src}",
     ))
 
-    is_privileged = bool(privileged_names)
+    is_privileged = privileged_total > 0
+    priv_src = _cap_names(privileged_names, privileged_total) if is_privileged else _cap_names(all_names, len(containers))
     facts.append(Fact(
-        key="docker.privileged",
-        value=is_privileged,
-        source=f"docker_inspect:{_cap_names(privileged_names if is_privileged else all_names)}",
+        "docker.privileged",
+        is_privileged,
+        f"docker_inspect:{priv_src}",
     ))
 
     return facts
 
 
+@functools.lru_cache(maxsize=256)
+def _is_root_user(user: str) -> bool:
+    """True if a Config.User string means running as root.
+
+    Empty user, "root", or UID 0 all count. Cached because hosts tend to
+    reuse a handful of user strings across many containers.
+    """
+    return not user or user == "root" or user.split(":")[0] == "0"
+
+
 _SOURCE_NAME_LIMIT = 5
 
 
-def _cap_names(names: list[str]) -> str:
-    """Join container names, capping at _SOURCE_NAME_LIMIT with a count suffix."""
-    if len(names) <= _SOURCE_NAME_LIMIT:
+def _cap_names(names: list[str], total: int) -> str:
+    """Join up to _SOURCE_NAME_LIMIT collected names, noting how many more exist."""
+    if total <= _SOURCE_NAME_LIMIT:
         return ",".join(names)
-    shown = ",".join(names[:_SOURCE_NAME_LIMIT])
-    return f"{shown} (+{len(names) - _SOURCE_NAME_LIMIT} more)"
+    return f"{','.join(names)} (+{total - _SOURCE_NAME_LIMIT} more)"
 
 
 def _get_running_container_ids() -> tuple[list[str] | None, str | None]:
@@ -117,12 +149,14 @@ def _get_running_container_ids() -> tuple[list[str] | None, str | None]:
 def _inspect_containers(container_ids: list[str]) -> list[dict] | None:
     """Run docker inspect and return parsed JSON, or None on failure."""
     try:
+        # No text=True: inspect output can be large, and the JSON parsers
+        # accept the UTF-8 bytes directly, so skip the upfront decode.
         result = subprocess.run(
             ["docker", "inspect", *container_ids],
-            capture_output=True, text=True, timeout=30,
+            capture_output=True, timeout=30,
         )
         if result.returncode != 0:
             return None
-        return json.loads(result.stdout)
-    except (FileNotFoundError, subprocess.TimeoutExpired, json.JSONDecodeError, OSError):
+        return _loads_json(result.stdout)
+    except (FileNotFoundError, subprocess.TimeoutExpired, ValueError, OSError):
         return None
@@ -6,35 +6,70 @@ from typing import Any
 
 import yaml
 
+try:  # Optional accelerator; stdlib json is the fallback.
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 from ...core.models import Fact
 
 
+def _loads_json(data: bytes):
+    """Parse JSON with orjson when installed, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Prefer libyaml's C loader when available; behaves identically to SafeLoader.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # OpenClaw bind modes that map to public exposure
-_PUBLIC_BIND_MODES = {"0.0.0.0", "::", "lan", "public"}
-_LOOPBACK_BIND_MODES = {"loopback", "localhost", "127.0.0.1", "::1"}
+_PUBLIC_BIND_MODES = frozenset({"0.0.0.0", "::", "lan", "public"})
+_LOOPBACK_BIND_MODES = frozenset({"loopback", "localhost", "127.0.0.1", "::1"})
+
+# Flat lookup table for bind-mode normalization, derived from the sets above
+_BIND_ADDRESS_BY_MODE = (
+    {m: "127.0.0.1" for m in _LOOPBACK_BIND_MODES}
+    | {m: "0.0.0.0" for m in _PUBLIC_BIND_MODES}
+)
 
 # Auth modes that count as "auth enabled"
-_AUTH_ENABLED_MODES = {"token", "password", "trusted-proxy"}
+_AUTH_ENABLED_MODES = frozenset({"token", "password", "trusted-proxy"})
 
 # Tool profiles that include shell/exec capabilities
-_SHELL_PROFILES = {"full", "coding"}
+_SHELL_PROFILES = frozenset({"full", "coding"})
 
 # Tools considered "shell-like" for deny-list checking
-_SHELL_TOOLS = {"exec", "bash", "process", "group:runtime"}
+_SHELL_TOOLS = frozenset({"exec", "bash", "process", "group:runtime"})
+
+# Tools considered "browser-like" for deny-list checking
+_BROWSER_TOOLS = frozenset({"browser", "group:ui"})
 
 # Minimum token length (chars) considered acceptable
 _MIN_TOKEN_LENGTH = 32
 
+# Precompiled config key paths, split once at import time for _deep_get
+_P_SANDBOX_MODE = ("agents", "defaults", "sandbox", "mode")
+_P_TOOLS_DENY = ("tools", "deny")
+_P_TOOLS_PROFILE = ("tools", "profile")
+_P_COMMANDS_BASH = ("commands", "bash")
+_P_BROWSER_ENABLED = ("browser", "enabled")
+_P_REDACT_SENSITIVE = ("logging", "redactSensitive")
+_P_YAML_BIND = ("server", "bind_address")
+_P_YAML_AUTH = ("auth", "enabled")
+
 # Common placeholder tokens that should always be flagged
-_WEAK_TOKEN_PATTERNS = {
+_WEAK_TOKEN_PATTERNS = frozenset({
     "changeme", "default", "password", "secret", "token", "admin",
     "1234", "test", "example", "placeholder", "replace_me", "fixme",
-}
+})
 
 
 class OpenClawConfigScanner:
     """Reads an OpenClaw config file and extracts security-relevant facts."""
 
+    __slots__ = ()
     name = "openclaw_config"
 
     def scan(self, config_paths: list[Path]) -> list[Fact]:
@@ -56,32 +91,45 @@ class OpenClawConfigScanner:
 
 def _load_config(path: Path) -> dict | None:
     """Load a config file as a dict, auto-detecting JSON vs YAML."""
+    # Read raw bytes: both json.loads and yaml.load accept UTF-8 bytes
+    # directly, so there is no need to decode up front.
     try:
-        text = path.read_text(encoding="utf-8")
+        data = path.read_bytes()
     except OSError:
         return None
 
     if path.suffix == ".json":
         try:
-            return json.loads(text) or {}
-        except json.JSONDecodeError:
+            return _loads_json(data) or {}
+        except ValueError:  # covers JSONDecodeError and bad UTF-8
             return None
 
-    # Try JSON first (handles .json or files that happen to be JSON)
-    try:
-        result = json.loads(text)
-        if isinstance(result, dict):
-            return result
-    except (json.JSONDecodeError, ValueError):
-        pass
+    # Try JSON first (handles .json or files that happen to be JSON), but
+    # only when the first meaningful byte can open a JSON object — anything
+    # else is a guaranteed parse failure we can skip.
+    if _first_content_byte(data) == b"{":
+        try:
+            result = _loads_json(data)
+            if isinstance(result, dict):
+                return result
+        except ValueError:
+            pass
 
     # Fall back to YAML
     try:
-        return yaml.safe_load(text) or {}
+        return yaml.load(data, Loader=_YamlLoader) or {}
     except yaml.YAMLError:
         return None
 
 
+def _first_content_byte(data: bytes) -> bytes:
+    """Return the first non-whitespace byte (as a 1-length slice), or b''."""
+    for i in range(len(data)):
+        if data[i] not in b" \t\r\n":
+            return data[i:i + 1]
+    return b""
+
+
 def _is_json_format(path: Path, config: dict) -> bool:
     """Detect whether this is an OpenClaw JSON config (openclaw.json style)."""
     if path.suffix == ".json":
@@ -93,49 +141,59 @@ def _is_json_format(path: Path, config: dict) -> bool:
 def _extract_json_facts(config: dict, source: str) -> list[Fact]:
     """Extract facts from OpenClaw's native JSON config (openclaw.json)."""
     facts: list[Fact] = []
+    append = facts.append  # bound once; this is the hottest emit path
     defaulted = f"{source} (defaulted)"
 
-    # gateway.bind → network.bind_address
-    bind = _deep_get(config, "gateway.bind")
-    if bind is not None:
-        facts.append(Fact(
-            key="network.bind_address",
-            value=_normalize_json_bind(bind),
-            source=source,
-        ))
-
-    # gateway.auth.mode → runtime.auth_enabled + runtime.auth_mode
-    auth_mode = _deep_get(config, "gateway.auth.mode")
-    if auth_mode is not None:
-        mode_str = str(auth_mode).strip().lower()
-        facts.append(Fact(key="runtime.auth_enabled", value=mode_str in _AUTH_ENABLED_MODES, source=source))
-        facts.append(Fact(key="runtime.auth_mode", value=mode_str, source=source))
-    else:
-        if "gateway" in config:
-            facts.append(Fact(key="runtime.auth_enabled", value=False, source=source))
-            facts.append(Fact(key="runtime.auth_mode", value="none", source=defaulted))
-
-    # gateway.auth.token → runtime.auth_token_length + runtime.auth_token_weak
-    token = _deep_get(config, "gateway.auth.token")
-    if token is not None:
-        token_str = str(token)
-        facts.append(Fact(key="runtime.auth_token_length", value=len(token_str), source=source))
-        is_weak = len(token_str) < _MIN_TOKEN_LENGTH or token_str.strip().lower() in _WEAK_TOKEN_PATTERNS
-        facts.append(Fact(key="runtime.auth_token_weak", value=is_weak, source=source))
+    # All gateway.* probes share one subtree; fetch it once and skip them
+    # entirely when the config has no gateway section.
+    gateway = config.get("gateway")
+    if isinstance(gateway, dict):
+        # gateway.bind → network.bind_address
+        bind = gateway.get("bind")
+        if bind is not None:
+            append(Fact("network.bind_address", _normalize_json_bind(bind), source))
+
+        auth = gateway.get("auth")
+        if not isinstance(auth, dict):
+            auth = {}
+
+        # gateway.auth.mode → runtime.auth_enabled + runtime.auth_mode
+        auth_mode = auth.get("mode")
+        if auth_mode is not None:
+            mode_str = str(auth_mode).strip().lower()
+            append(Fact("runtime.auth_enabled", mode_str in _AUTH_ENABLED_MODES, source))
+            append(Fact("runtime.auth_mode", mode_str, source))
+        else:
+            append(Fact("runtime.auth_enabled", False, source))
+            append(Fact("runtime.auth_mode", "none", defaulted))
+
+        # gateway.auth.token → runtime.auth_token_length + runtime.auth_token_weak
+        token = auth.get("token")
+        if token is not None:
+            token_str = str(token)
+            append(Fact("runtime.auth_token_length", len(token_str), source))
+            is_weak = len(token_str) < _MIN_TOKEN_LENGTH or token_str.strip().lower() in _WEAK_TOKEN_PATTERNS
+            append(Fact("runtime.auth_token_weak", is_weak, source))
+    elif "gateway" in config:
+        # Present but not a mapping: same auth defaults as an empty gateway
+        append(Fact("runtime.auth_enabled", False, source))
+        append(Fact("runtime.auth_mode", "none", defaulted))
 
     # agents.defaults.sandbox.mode → sandbox.enabled (default: "off")
-    sandbox_mode = _deep_get(config, "agents.defaults.sandbox.mode")
+    sandbox_mode = _deep_get(config, _P_SANDBOX_MODE)
     if sandbox_mode is not None:
-        facts.append(Fact(key="sandbox.enabled", value=str(sandbox_mode).strip().lower() != "off", source=source))
+        append(Fact("sandbox.enabled", str(sandbox_mode).strip().lower() != "off", source))
     else:
-        facts.append(Fact(key="sandbox.enabled", value=False, source=defaulted))
+        append(Fact("sandbox.enabled", False, defaulted))
 
     # tools.shell_enabled — precedence: commands.bash → tools.deny → tools.profile → default
-    tools_deny = _deep_get(config, "tools.deny") or []
-    deny_set = {str(d).strip().lower() for d in tools_deny}
-    shell_denied = bool(_SHELL_TOOLS & deny_set)
+    tools_deny = _deep_get(config, _P_TOOLS_DENY) or []
+    deny_set = frozenset(str(d).strip().lower() for d in tools_deny)
+    # isdisjoint short-circuits and allocates no intersection set; the empty
+    # deny list (the common case) is answered by the bool() check alone.
+    shell_denied = bool(deny_set) and not _SHELL_TOOLS.isdisjoint(deny_set)
 
-    commands_bash = _deep_get(config, "commands.bash")
+    commands_bash = _deep_get(config, _P_COMMANDS_BASH)
     if isinstance(commands_bash, bool):
         # Authoritative: commands.bash is the real gate (e.g. Hostinger configs)
         shell_enabled = commands_bash and not shell_denied
@@ -146,7 +204,7 @@ def _extract_json_facts(config: dict, source: str) -> list[Fact]:
         shell_src = source
     else:
         # Infer from tools.profile (default: "full" → shell enabled)
-        tools_profile = _deep_get(config, "tools.profile")
+        tools_profile = _deep_get(config, _P_TOOLS_PROFILE)
         if tools_profile is not None:
             profile = str(tools_profile).strip().lower()
             shell_src = source
@@ -155,29 +213,25 @@ def _extract_json_facts(config: dict, source: str) -> list[Fact]:
             shell_src = defaulted
         shell_enabled = profile in _SHELL_PROFILES
 
-    facts.append(Fact(
-        key="tools.shell_enabled",
-        value=shell_enabled,
-        source=shell_src,
-    ))
+    append(Fact("tools.shell_enabled", shell_enabled, shell_src))
 
     # browser.enabled (default: true) + tools.deny check
-    browser_val = _deep_get(config, "browser.enabled")
-    browser_denied = bool({"browser", "group:ui"} & deny_set)
+    browser_val = _deep_get(config, _P_BROWSER_ENABLED)
+    browser_denied = bool(deny_set) and not _BROWSER_TOOLS.isdisjoint(deny_set)
     if browser_val is not None:
-        facts.append(Fact(key="browser.enabled", value=bool(browser_val) and not browser_denied, source=source))
+        append(Fact("browser.enabled", bool(browser_val) and not browser_denied, source))
     else:
-        facts.append(Fact(key="browser.enabled", value=not browser_denied, source=defaulted))
+        append(Fact("browser.enabled", not browser_denied, defaulted))
 
     # logging.redactSensitive → logging.redaction_enabled (default: "tools")
-    redact = _deep_get(config, "logging.redactSensitive")
+    redact = _deep_get(config, _P_REDACT_SENSITIVE)
     if redact is not None:
-        facts.append(Fact(key="logging.redaction_enabled", value=str(redact).strip().lower() != "off", source=source))
+        append(Fact("logging.redaction_enabled", str(redact).strip().lower() != "off", source))
     else:
-        facts.append(Fact(key="logging.redaction_enabled", value=True, source=defaulted))
+        append(Fact("logging.redaction_enabled", True, defaulted))
 
     # File logs are never redacted per OpenClaw docs
-    facts.append(Fact(key="logging.file_logs_redacted", value=False, source=f"{source} (documented behavior)"))
+    append(Fact("logging.file_logs_redacted", False, f"{source} (documented behavior)"))
 
     return facts
 
@@ -185,22 +239,15 @@ def _extract_json_facts(config: dict, source: str) -> list[Fact]:
 def _extract_yaml_facts(config: dict, source: str) -> list[Fact]:
     """Extract facts from legacy YAML config format."""
     facts: list[Fact] = []
+    append = facts.append
 
-    bind = _deep_get(config, "server.bind_address")
+    bind = _deep_get(config, _P_YAML_BIND)
     if bind is not None:
-        facts.append(Fact(
-            key="network.bind_address",
-            value=_normalize_bind_address(bind),
-            source=source,
-        ))
+        append(Fact("network.bind_address", _normalize_bind_address(bind), source))
 
-    auth = _deep_get(config, "auth.enabled")
+    auth = _deep_get(config, _P_YAML_AUTH)
     if auth is not None:
-        facts.append(Fact(
-            key="runtime.auth_enabled",
-            value=_normalize_bool(auth),
-            source=source,
-        ))
+        append(Fact("runtime.auth_enabled", _normalize_bool(auth), source))
 
     return facts
 
@@ -212,12 +259,8 @@ def _normalize_json_bind(value: Any) -> str:
     Map non-loopback modes to "0.0.0.0" so NET-001 can detect public exposure.
     """
     s = str(value).strip().lower()
-    if s in _LOOPBACK_BIND_MODES:
-        return "127.0.0.1"
-    if s in _PUBLIC_BIND_MODES:
-        return "0.0.0.0"
-    # Unknown mode — pass through for manual inspection
-    return s
+    # Unknown modes pass through for manual inspection
+    return _BIND_ADDRESS_BY_MODE.get(s, s)
 
 
 def _normalize_bind_address(value: Any) -> str:
@@ -225,23 +268,26 @@ def _normalize_bind_address(value: Any) -> str:
     return str(value).strip()
 
 
+# String spellings of booleans accepted in legacy YAML configs
+_BOOL_BY_STRING = {
+    "true": True, "1": True, "yes": True,
+    "false": False, "0": False, "no": False,
+}
+
+
 def _normalize_bool(value: Any) -> bool | Any:
     """Coerce string booleans to actual bools. Pass through non-strings unchanged."""
     if isinstance(value, bool):
         return value
     if isinstance(value, str):
-        lowered = value.strip().lower()
-        if lowered in ("true", "1", "yes"):
-            return True
-        if lowered in ("false", "0", "no"):
-            return False
+        return _BOOL_BY_STRING.get(value.strip().lower(), value)
     return value
 
 
-def _deep_get(d: dict, dotted_key: str) -> Any | None:
-    """Traverse nested dicts using a dotted key path."""
+def _deep_get(d: dict, path: tuple[str, ...]) -> Any | None:
+    """Traverse nested dicts using a pre-split key path."""
     current: Any = d
-    for k in dotted_key.split("."):
+    for k in path:
         if not isinstance(current, dict):
             return None
         current = current.get(k)
@@ -16,6 +16,7 @@ _IS_POSIX = os.name != "nt"
 class FilePermissionsScanner:
     """Checks file permissions on OpenClaw config and .env files."""
 
+    __slots__ = ()
     name = "file_permissions"
 
     def scan(self, config_paths: list[Path]) -> list[Fact]:
@@ -28,38 +29,23 @@ class FilePermissionsScanner:
             # Config file: only check world-writable
             mode = _get_mode(config_path)
             facts.append(Fact(
-                key="files.config_world_writable",
-                value=_is_world_writable(mode),
-                source=f"file_permissions:{config_path}",
+                "files.config_world_writable",
+                _is_world_writable(mode),
+                f"file_permissions:{config_path}",
             ))
 
-            # .env: check once per directory
+            # .env: check once per directory. A single stat() covers both the
+            # existence probe and the mode bits; a missing or non-regular
+            # .env yields mode None, which reads as not world-accessible.
             if config_dir not in checked_dirs:
                 checked_dirs.add(config_dir)
                 env_path = config_dir / ".env"
-                if env_path.is_file():
-                    env_mode = _get_mode(env_path)
-                    facts.append(Fact(
-                        key="files.env_world_readable",
-                        value=_is_world_readable(env_mode),
-                        source=f"file_permissions:{env_path}",
-                    ))
-                    facts.append(Fact(
-                        key="files.env_world_writable",
-                        value=_is_world_writable(env_mode),
-                        source=f"file_permissions:{env_path}",
-                    ))
-                else:
-                    facts.append(Fact(
-                        key="files.env_world_readable",
-                        value=False,
-                        source=f"file_permissions:{env_path}",
-                    ))
-                    facts.append(Fact(
-                        key="files.env_world_writable",
-                        value=False,
-                        source=f"file_permissions:{env_path}",
-                    ))
+                env_source = f"file_permissions:{env_path}"
+                env_mode = _get_mode(env_path)
+                if env_mode is not None and not stat.S_ISREG(env_mode):
+                    env_mode = None
+                facts.append(Fact("files.env_world_readable", _is_world_readable(env_mode), env_source))
+                facts.append(Fact("files.env_world_writable", _is_world_writable(env_mode), env_source))
 
         return facts
 
@@ -7,6 +7,8 @@ No recursion, no entropy analysis, no filesystem crawling.
 """
 from __future__ import annotations
 
+import re
+import stat
 from pathlib import Path
 
 from ...core.models import Fact
@@ -22,13 +24,19 @@ _KNOWN_KEY_NAMES = [
     "HF_TOKEN",
 ]
 
-# Lowercase versions for case-insensitive matching in config files
-_KNOWN_KEY_NAMES_LOWER = [k.lower() for k in _KNOWN_KEY_NAMES]
+# "KEY=" byte prefixes for .env lines; startswith takes the whole tuple at
+# once, and matching on bytes skips decoding the file entirely
+_ENV_KEY_PREFIXES = tuple((k + "=").encode("ascii") for k in _KNOWN_KEY_NAMES)
+
+# Single alternation over all key names: one pass over the file instead of
+# one substring scan per key. IGNORECASE avoids lowering a copy of the text.
+_KEY_NAME_RE = re.compile("|".join(map(re.escape, _KNOWN_KEY_NAMES)), re.IGNORECASE)
 
 
 class SecretsLiteScanner:
     """Checks for well-known API key names in .env and config files."""
 
+    __slots__ = ()
     name = "secrets_lite"
 
     def scan(self, config_paths: list[Path]) -> list[Fact]:
@@ -38,56 +46,66 @@ class SecretsLiteScanner:
         for config_path in config_paths:
             config_dir = config_path.parent
 
-            # Check .env once per directory
+            # Check .env once per directory. One stat-gated read answers
+            # both existence and key presence.
             if config_dir not in checked_dirs:
                 checked_dirs.add(config_dir)
                 env_path = config_dir / ".env"
-                env_exists = env_path.is_file()
+                env_source = f"secrets_lite:{env_path}"
+                has_keys = _scan_env_for_keys(env_path)
 
-                facts.append(Fact(
-                    key="secrets.env_file_present",
-                    value=env_exists,
-                    source=f"secrets_lite:{env_path}",
-                ))
+                facts.append(Fact("secrets.env_file_present", has_keys is not None, env_source))
 
-                facts.append(Fact(
-                    key="secrets.api_key_in_env_file",
-                    value=_scan_env_for_keys(env_path) if env_exists else False,
-                    source=f"secrets_lite:{env_path}",
-                ))
+                facts.append(Fact("secrets.api_key_in_env_file", bool(has_keys), env_source))
 
             # Check config file
             facts.append(Fact(
-                key="secrets.api_key_in_config",
-                value=_scan_file_for_key_names(config_path),
-                source=f"secrets_lite:{config_path}",
+                "secrets.api_key_in_config",
+                _scan_file_for_key_names(config_path),
+                f"secrets_lite:{config_path}",
             ))
 
         return facts
 
 
-def _scan_env_for_keys(env_path: Path) -> bool:
-    """Return True if .env contains any line starting with a known API key name."""
+def _scan_env_for_keys(env_path: Path) -> bool | None:
+    """Scan .env for lines starting with a known API key name.
+
+    Streams the file line by line and stops at the first hit, rather than
+    reading the whole file up front. Returns None when no regular .env
+    file exists, so callers get existence for free; a file that exists
+    but cannot be read (e.g. root-owned, scanned unprivileged) still
+    counts as present, with no keys found.
+    """
+    # Stat before opening: open() on a non-regular .env (a FIFO, say)
+    # can block indefinitely, so anything but a regular file is treated
+    # as absent without touching it.
     try:
-        text = env_path.read_text(encoding="utf-8", errors="replace")
+        mode = env_path.stat().st_mode
     except OSError:
-        return False
+        return None
+    if not stat.S_ISREG(mode):
+        return None
 
-    for line in text.splitlines():
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        for key_name in _KNOWN_KEY_NAMES:
-            if stripped.startswith(key_name + "="):
-                return True
+    try:
+        with env_path.open("rb") as f:
+            for line in f:
+                stripped = line.strip()
+                if not stripped or stripped.startswith(b"#"):
+                    continue
+                if stripped.startswith(_ENV_KEY_PREFIXES):
+                    return True
+    except OSError:
+        # Present but unreadable: no key evidence either way.
+        return False
     return False
 
 
 def _scan_file_for_key_names(file_path: Path) -> bool:
     """Return True if the file text contains any known API key name (case-insensitive)."""
     try:
-        text = file_path.read_text(encoding="utf-8", errors="replace").lower()
+        text = file_path.read_text(encoding="utf-8", errors="replace")
     except OSError:
         return False
 
-    return any(key in text for key in _KNOWN_KEY_NAMES_LOWER)
+    return _KEY_NAME_RE.search(text) is not None
@@ -0,0 +1,47 @@
+from pathlib import Path
+
+import pytest
+
+from clawshield.core.engine import PolicyEngine
+
+_DEFAULT_CONFIG = "server:\n  port: 8080\n"
+_DEFAULT_ENV = "FOO=bar\n"
+
+POLICY_PATH = Path(__file__).parent.parent / "clawshield" / "policies" / "vps_public.yaml"
+
+
+@pytest.fixture(scope="session")
+def engine() -> PolicyEngine:
+    """A PolicyEngine loaded from the bundled policy, shared across the session.
+
+    The engine is immutable after loading and evaluate() keeps no state
+    between calls, so one instance serves every test without re-parsing
+    and re-validating the policy YAML per test.
+    """
+    return PolicyEngine(POLICY_PATH)
+
+
+@pytest.fixture
+def write_config(tmp_path):
+    """Write a config file into tmp_path and return its path.
+
+    Shared by the scanner test modules, which previously each carried
+    their own copy of this helper.
+    """
+    def _write(content: str = _DEFAULT_CONFIG) -> Path:
+        config = tmp_path / "config.yaml"
+        config.write_text(content)
+        return config
+
+    return _write
+
+
+@pytest.fixture
+def write_env(tmp_path):
+    """Write a .env file into tmp_path and return its path."""
+    def _write(content: str = _DEFAULT_ENV) -> Path:
+        env = tmp_path / ".env"
+        env.write_text(content)
+        return env
+
+    return _write
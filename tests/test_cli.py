@@ -3,6 +3,8 @@ import json
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from clawshield import __version__
 from clawshield.__main__ import main
 
@@ -218,6 +220,15 @@ def test_doc001_title_indicates_host_scope(capsys):
     assert "Host has" in doc001[0]["title"]
 
 
+# --- --version ---
+
+def test_version_flag_prints_version(capsys):
+    with pytest.raises(SystemExit) as excinfo, patch("sys.argv", ["clawshield", "--version"]):
+        main()
+    assert excinfo.value.code == 0
+    assert __version__ in capsys.readouterr().out
+
+
 # --- Packaging self-check ---
 
 def test_bundled_policy_exists():
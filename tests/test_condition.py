@@ -60,6 +60,16 @@ def test_fact_present_but_none_still_evaluates():
     assert evaluate_condition(condition, {"x": None}) is True
 
 
+def test_unhashable_fact_value_in_frozen_set_is_false():
+    """An unhashable fact value against a frozen 'in' set is not contained.
+
+    The engine freezes 'in' values to frozensets; a list-valued fact
+    must evaluate False instead of raising TypeError.
+    """
+    condition = {"fact": "x", "op": "in", "value": frozenset({"a", "b"})}
+    assert evaluate_condition(condition, {"x": ["a"]}) is False
+
+
 # --- validate_condition ---
 
 def test_validate_valid_condition():
@@ -6,16 +6,36 @@ import yaml
 from clawshield.core.engine import PolicyEngine, PolicyLoadError
 from clawshield.core.models import Fact
 
+# Match the engine: use libyaml's C dumper when available.
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _dump_policy(policy: dict) -> str:
+    return yaml.dump(policy, Dumper=_YamlDumper)
+
+
 POLICY_PATH = Path(__file__).parent.parent / "clawshield" / "policies" / "vps_public.yaml"
 
+def _f(key, value, source="test"):
+    """Shorthand Fact builder for test fact lists."""
+    return Fact(key=key, value=value, source=source)
+
+
+# Facts reused across tests. The engine never mutates evidence and Fact
+# is a slots dataclass treated as immutable, so sharing instances is safe.
+SAFE_BIND = _f("network.bind_address", "127.0.0.1")
+PUBLIC_BIND = _f("network.bind_address", "0.0.0.0")
+AUTH_ON = _f("runtime.auth_enabled", True)
+AUTH_OFF = _f("runtime.auth_enabled", False)
+SAFE_BASELINE = [SAFE_BIND, AUTH_ON]
+
 
 # --- evaluation ---
 
-def test_net001_finding_on_vulnerable_config():
-    engine = PolicyEngine(POLICY_PATH)
+def test_net001_finding_on_vulnerable_config(engine):
     facts = [
-        Fact(key="network.bind_address", value="0.0.0.0", source="test"),
-        Fact(key="runtime.auth_enabled", value=False, source="test"),
+        PUBLIC_BIND,
+        AUTH_OFF,
     ]
     result = engine.evaluate(facts)
 
@@ -29,33 +49,28 @@ def test_net001_finding_on_vulnerable_config():
     assert result.warnings == []
 
 
-def test_no_finding_on_safe_config():
-    engine = PolicyEngine(POLICY_PATH)
+def test_no_finding_on_safe_config(engine):
     facts = [
-        Fact(key="network.bind_address", value="127.0.0.1", source="test"),
-        Fact(key="runtime.auth_enabled", value=True, source="test"),
+        *SAFE_BASELINE,
     ]
     result = engine.evaluate(facts)
     assert len(result.findings) == 0
 
 
-def test_no_finding_when_auth_enabled():
-    engine = PolicyEngine(POLICY_PATH)
+def test_no_finding_when_auth_enabled(engine):
     facts = [
-        Fact(key="network.bind_address", value="0.0.0.0", source="test"),
-        Fact(key="runtime.auth_enabled", value=True, source="test"),
+        PUBLIC_BIND,
+        AUTH_ON,
     ]
     result = engine.evaluate(facts)
     assert len(result.findings) == 0
 
 
-def test_doc001_finding_on_root_container():
-    engine = PolicyEngine(POLICY_PATH)
+def test_doc001_finding_on_root_container(engine):
     facts = [
-        Fact(key="network.bind_address", value="127.0.0.1", source="test"),
-        Fact(key="runtime.auth_enabled", value=True, source="test"),
-        Fact(key="docker.user", value="root", source="docker_inspect:openclaw"),
-        Fact(key="docker.privileged", value=False, source="docker_inspect:openclaw"),
+        *SAFE_BASELINE,
+        _f("docker.user", "root", "docker_inspect:openclaw"),
+        _f("docker.privileged", False, "docker_inspect:openclaw"),
     ]
     result = engine.evaluate(facts)
     assert len(result.findings) == 1
@@ -64,328 +79,139 @@ def test_doc001_finding_on_root_container():
     assert f.severity == "high"
 
 
-def test_doc001_finding_on_privileged_container():
-    engine = PolicyEngine(POLICY_PATH)
+def test_doc001_finding_on_privileged_container(engine):
     facts = [
-        Fact(key="network.bind_address", value="127.0.0.1", source="test"),
-        Fact(key="runtime.auth_enabled", value=True, source="test"),
-        Fact(key="docker.user", value="non-root", source="docker_inspect:openclaw"),
-        Fact(key="docker.privileged", value=True, source="docker_inspect:openclaw"),
+        *SAFE_BASELINE,
+        _f("docker.user", "non-root", "docker_inspect:openclaw"),
+        _f("docker.privileged", True, "docker_inspect:openclaw"),
     ]
     result = engine.evaluate(facts)
     assert len(result.findings) == 1
     assert result.findings[0].rule_id == "DOC-001"
 
 
-def test_no_doc001_on_safe_container():
-    engine = PolicyEngine(POLICY_PATH)
+def test_no_doc001_on_safe_container(engine):
     facts = [
-        Fact(key="network.bind_address", value="127.0.0.1", source="test"),
-        Fact(key="runtime.auth_enabled", value=True, source="test"),
-        Fact(key="docker.user", value="non-root", source="docker_inspect:openclaw"),
-        Fact(key="docker.privileged", value=False, source="docker_inspect:openclaw"),
+        *SAFE_BASELINE,
+        _f("docker.user", "non-root", "docker_inspect:openclaw"),
+        _f("docker.privileged", False, "docker_inspect:openclaw"),
     ]
     result = engine.evaluate(facts)
     assert len(result.findings) == 0
 
 
-def test_both_rules_fire_together():
-    engine = PolicyEngine(POLICY_PATH)
-    facts = [
-        Fact(key="network.bind_address", value="0.0.0.0", source="test"),
-        Fact(key="runtime.auth_enabled", value=False, source="test"),
-        Fact(key="docker.user", value="root", source="docker_inspect:openclaw"),
-        Fact(key="docker.privileged", value=True, source="docker_inspect:openclaw"),
-    ]
-    result = engine.evaluate(facts)
-    rule_ids = {f.rule_id for f in result.findings}
-    assert rule_ids == {"NET-001", "DOC-001"}
-
-
-def test_file001_finding_on_world_writable_config():
-    engine = PolicyEngine(POLICY_PATH)
-    facts = [
-        Fact(key="network.bind_address", value="127.0.0.1", source="test"),
-        Fact(key="runtime.auth_enabled", value=True, source="test"),
-        Fact(key="files.config_world_writable", value=True, source="file_permissions:test"),
-        Fact(key="files.env_world_readable", value=False, source="file_permissions:test"),
-        Fact(key="files.env_world_writable", value=False, source="file_permissions:test"),
-    ]
-    result = engine.evaluate(facts)
-    file_findings = [f for f in result.findings if f.rule_id == "FILE-001"]
-    assert len(file_findings) == 1
-    assert file_findings[0].severity == "high"
-
-
-def test_file001_finding_on_env_world_readable():
-    engine = PolicyEngine(POLICY_PATH)
-    facts = [
-        Fact(key="network.bind_address", value="127.0.0.1", source="test"),
-        Fact(key="runtime.auth_enabled", value=True, source="test"),
-        Fact(key="files.config_world_writable", value=False, source="file_permissions:test"),
-        Fact(key="files.env_world_readable", value=True, source="file_permissions:test"),
-        Fact(key="files.env_world_writable", value=False, source="file_permissions:test"),
-    ]
-    result = engine.evaluate(facts)
-    file_findings = [f for f in result.findings if f.rule_id == "FILE-001"]
-    assert len(file_findings) == 1
-
-
-def test_no_file001_on_safe_permissions():
-    engine = PolicyEngine(POLICY_PATH)
-    facts = [
-        Fact(key="network.bind_address", value="127.0.0.1", source="test"),
-        Fact(key="runtime.auth_enabled", value=True, source="test"),
-        Fact(key="files.config_world_writable", value=False, source="file_permissions:test"),
-        Fact(key="files.env_world_readable", value=False, source="file_permissions:test"),
-        Fact(key="files.env_world_writable", value=False, source="file_permissions:test"),
-    ]
-    result = engine.evaluate(facts)
-    file_findings = [f for f in result.findings if f.rule_id == "FILE-001"]
-    assert len(file_findings) == 0
-
-
-# --- NET-002 ---
-
-def test_net002_fires_on_public_bind_with_password_auth():
-    engine = PolicyEngine(POLICY_PATH)
-    facts = [
-        Fact(key="network.bind_address", value="0.0.0.0", source="test"),
-        Fact(key="runtime.auth_enabled", value=True, source="test"),
-        Fact(key="runtime.auth_mode", value="password", source="test"),
-    ]
-    result = engine.evaluate(facts)
-    net002 = [f for f in result.findings if f.rule_id == "NET-002"]
-    assert len(net002) == 1
-    assert net002[0].severity == "high"
-
-
-def test_net002_does_not_fire_with_token_auth():
-    engine = PolicyEngine(POLICY_PATH)
-    facts = [
-        Fact(key="network.bind_address", value="0.0.0.0", source="test"),
-        Fact(key="runtime.auth_enabled", value=True, source="test"),
-        Fact(key="runtime.auth_mode", value="token", source="test"),
-    ]
-    result = engine.evaluate(facts)
-    net002 = [f for f in result.findings if f.rule_id == "NET-002"]
-    assert len(net002) == 0
-
-
-def test_net002_does_not_fire_on_localhost():
-    engine = PolicyEngine(POLICY_PATH)
-    facts = [
-        Fact(key="network.bind_address", value="127.0.0.1", source="test"),
-        Fact(key="runtime.auth_mode", value="password", source="test"),
-    ]
-    result = engine.evaluate(facts)
-    net002 = [f for f in result.findings if f.rule_id == "NET-002"]
-    assert len(net002) == 0
-
-
-# --- AUTH-001 ---
-
-def test_auth001_fires_on_weak_token():
-    engine = PolicyEngine(POLICY_PATH)
-    facts = [
-        Fact(key="network.bind_address", value="127.0.0.1", source="test"),
-        Fact(key="runtime.auth_enabled", value=True, source="test"),
-        Fact(key="runtime.auth_token_weak", value=True, source="test"),
-    ]
-    result = engine.evaluate(facts)
-    auth001 = [f for f in result.findings if f.rule_id == "AUTH-001"]
-    assert len(auth001) == 1
-    assert auth001[0].severity == "medium"
-
-
-def test_auth001_does_not_fire_on_strong_token():
-    engine = PolicyEngine(POLICY_PATH)
-    facts = [
-        Fact(key="network.bind_address", value="127.0.0.1", source="test"),
-        Fact(key="runtime.auth_enabled", value=True, source="test"),
-        Fact(key="runtime.auth_token_weak", value=False, source="test"),
-    ]
-    result = engine.evaluate(facts)
-    auth001 = [f for f in result.findings if f.rule_id == "AUTH-001"]
-    assert len(auth001) == 0
-
-
-# --- SANDBOX-001 ---
-
-def test_sandbox001_fires_when_disabled_with_shell():
-    engine = PolicyEngine(POLICY_PATH)
-    facts = [
-        Fact(key="network.bind_address", value="127.0.0.1", source="test"),
-        Fact(key="runtime.auth_enabled", value=True, source="test"),
-        Fact(key="sandbox.enabled", value=False, source="test"),
-        Fact(key="tools.shell_enabled", value=True, source="test"),
-        Fact(key="browser.enabled", value=False, source="test"),
-    ]
-    result = engine.evaluate(facts)
-    sandbox = [f for f in result.findings if f.rule_id == "SANDBOX-001"]
-    assert len(sandbox) == 1
-    assert sandbox[0].severity == "high"
-
-
-def test_sandbox001_fires_when_disabled_with_browser():
-    engine = PolicyEngine(POLICY_PATH)
+def test_both_rules_fire_together(engine):
     facts = [
-        Fact(key="network.bind_address", value="127.0.0.1", source="test"),
-        Fact(key="runtime.auth_enabled", value=True, source="test"),
-        Fact(key="sandbox.enabled", value=False, source="test"),
-        Fact(key="tools.shell_enabled", value=False, source="test"),
-        Fact(key="browser.enabled", value=True, source="test"),
+        PUBLIC_BIND,
+        AUTH_OFF,
+        _f("docker.user", "root", "docker_inspect:openclaw"),
+        _f("docker.privileged", True, "docker_inspect:openclaw"),
     ]
     result = engine.evaluate(facts)
-    sandbox = [f for f in result.findings if f.rule_id == "SANDBOX-001"]
-    assert len(sandbox) == 1
+    assert result.rule_ids == {"NET-001", "DOC-001"}
 
 
-def test_sandbox001_does_not_fire_when_sandbox_enabled():
-    engine = PolicyEngine(POLICY_PATH)
+def test_file001_finding_on_world_writable_config(engine):
     facts = [
-        Fact(key="network.bind_address", value="127.0.0.1", source="test"),
-        Fact(key="runtime.auth_enabled", value=True, source="test"),
-        Fact(key="sandbox.enabled", value=True, source="test"),
-        Fact(key="tools.shell_enabled", value=True, source="test"),
-        Fact(key="browser.enabled", value=True, source="test"),
+        *SAFE_BASELINE,
+        _f("files.config_world_writable", True, "file_permissions:test"),
+        _f("files.env_world_readable", False, "file_permissions:test"),
+        _f("files.env_world_writable", False, "file_permissions:test"),
     ]
     result = engine.evaluate(facts)
-    sandbox = [f for f in result.findings if f.rule_id == "SANDBOX-001"]
-    assert len(sandbox) == 0
+    by_id = {f.rule_id: f for f in result.findings}
+    assert "FILE-001" in by_id
+    assert by_id["FILE-001"].severity == "high"
 
 
-def test_sandbox001_does_not_fire_when_no_risky_tools():
-    engine = PolicyEngine(POLICY_PATH)
+def test_file001_finding_on_env_world_readable(engine):
     facts = [
-        Fact(key="network.bind_address", value="127.0.0.1", source="test"),
-        Fact(key="runtime.auth_enabled", value=True, source="test"),
-        Fact(key="sandbox.enabled", value=False, source="test"),
-        Fact(key="tools.shell_enabled", value=False, source="test"),
-        Fact(key="browser.enabled", value=False, source="test"),
+        *SAFE_BASELINE,
+        _f("files.config_world_writable", False, "file_permissions:test"),
+        _f("files.env_world_readable", True, "file_permissions:test"),
+        _f("files.env_world_writable", False, "file_permissions:test"),
     ]
     result = engine.evaluate(facts)
-    sandbox = [f for f in result.findings if f.rule_id == "SANDBOX-001"]
-    assert len(sandbox) == 0
-
+    assert "FILE-001" in result.rule_ids
 
-# --- TOOL-001 ---
 
-def test_tool001_fires_when_shell_enabled():
-    engine = PolicyEngine(POLICY_PATH)
+def test_no_file001_on_safe_permissions(engine):
     facts = [
-        Fact(key="network.bind_address", value="127.0.0.1", source="test"),
-        Fact(key="runtime.auth_enabled", value=True, source="test"),
-        Fact(key="tools.shell_enabled", value=True, source="test"),
+        *SAFE_BASELINE,
+        _f("files.config_world_writable", False, "file_permissions:test"),
+        _f("files.env_world_readable", False, "file_permissions:test"),
+        _f("files.env_world_writable", False, "file_permissions:test"),
     ]
     result = engine.evaluate(facts)
-    tool001 = [f for f in result.findings if f.rule_id == "TOOL-001"]
-    assert len(tool001) == 1
-    assert tool001[0].severity == "medium"
-
-
-def test_tool001_does_not_fire_when_shell_disabled():
-    engine = PolicyEngine(POLICY_PATH)
-    facts = [
-        Fact(key="network.bind_address", value="127.0.0.1", source="test"),
-        Fact(key="runtime.auth_enabled", value=True, source="test"),
-        Fact(key="tools.shell_enabled", value=False, source="test"),
-    ]
+    assert "FILE-001" not in result.rule_ids
+
+
+# --- per-rule fire / no-fire matrix ---
+
+# Each row: (facts, rule under test, expected severity or None for "must
+# not fire"). SAFE_BASELINE keeps NET-001 quiet; rows swap in their own
+# bind/auth facts where the rule under test needs different ones.
+_RULE_MATRIX = [
+    pytest.param([PUBLIC_BIND, AUTH_ON, _f("runtime.auth_mode", "password")],
+                 "NET-002", "high", id="net002-public-password-auth"),
+    pytest.param([PUBLIC_BIND, AUTH_ON, _f("runtime.auth_mode", "token")],
+                 "NET-002", None, id="net002-token-auth"),
+    pytest.param([SAFE_BIND, _f("runtime.auth_mode", "password")],
+                 "NET-002", None, id="net002-localhost"),
+    pytest.param([*SAFE_BASELINE, _f("runtime.auth_token_weak", True)],
+                 "AUTH-001", "medium", id="auth001-weak-token"),
+    pytest.param([*SAFE_BASELINE, _f("runtime.auth_token_weak", False)],
+                 "AUTH-001", None, id="auth001-strong-token"),
+    pytest.param([*SAFE_BASELINE, _f("sandbox.enabled", False),
+                  _f("tools.shell_enabled", True), _f("browser.enabled", False)],
+                 "SANDBOX-001", "high", id="sandbox001-disabled-with-shell"),
+    pytest.param([*SAFE_BASELINE, _f("sandbox.enabled", False),
+                  _f("tools.shell_enabled", False), _f("browser.enabled", True)],
+                 "SANDBOX-001", "high", id="sandbox001-disabled-with-browser"),
+    pytest.param([*SAFE_BASELINE, _f("sandbox.enabled", True),
+                  _f("tools.shell_enabled", True), _f("browser.enabled", True)],
+                 "SANDBOX-001", None, id="sandbox001-sandbox-enabled"),
+    pytest.param([*SAFE_BASELINE, _f("sandbox.enabled", False),
+                  _f("tools.shell_enabled", False), _f("browser.enabled", False)],
+                 "SANDBOX-001", None, id="sandbox001-no-risky-tools"),
+    pytest.param([*SAFE_BASELINE, _f("tools.shell_enabled", True)],
+                 "TOOL-001", "medium", id="tool001-shell-enabled"),
+    pytest.param([*SAFE_BASELINE, _f("tools.shell_enabled", False)],
+                 "TOOL-001", None, id="tool001-shell-disabled"),
+    pytest.param([*SAFE_BASELINE, _f("browser.enabled", True)],
+                 "TOOL-002", "medium", id="tool002-browser-enabled"),
+    pytest.param([*SAFE_BASELINE, _f("browser.enabled", False)],
+                 "TOOL-002", None, id="tool002-browser-disabled"),
+    pytest.param([*SAFE_BASELINE, _f("logging.redaction_enabled", False)],
+                 "LOG-001", "medium", id="log001-redaction-disabled"),
+    pytest.param([*SAFE_BASELINE, _f("logging.redaction_enabled", True)],
+                 "LOG-001", None, id="log001-redaction-enabled"),
+    pytest.param([*SAFE_BASELINE, _f("logging.redaction_enabled", True),
+                  _f("logging.file_logs_redacted", False)],
+                 "LOG-002", "low", id="log002-console-redacted-files-not"),
+    # LOG-002 only fires when console redaction is on but file logs aren't.
+    pytest.param([*SAFE_BASELINE, _f("logging.redaction_enabled", False),
+                  _f("logging.file_logs_redacted", False)],
+                 "LOG-002", None, id="log002-redaction-fully-off"),
+]
+
+
+@pytest.mark.parametrize(("facts", "rule_id", "severity"), _RULE_MATRIX)
+def test_rule_matrix(engine, facts, rule_id, severity):
     result = engine.evaluate(facts)
-    tool001 = [f for f in result.findings if f.rule_id == "TOOL-001"]
-    assert len(tool001) == 0
+    if severity is None:
+        assert rule_id not in result.rule_ids
+    else:
+        by_id = {f.rule_id: f for f in result.findings}
+        assert rule_id in by_id
+        assert by_id[rule_id].severity == severity
 
 
-# --- TOOL-002 ---
-
-def test_tool002_fires_when_browser_enabled():
-    engine = PolicyEngine(POLICY_PATH)
+def test_duplicate_fact_warns_with_sources(engine):
     facts = [
-        Fact(key="network.bind_address", value="127.0.0.1", source="test"),
-        Fact(key="runtime.auth_enabled", value=True, source="test"),
-        Fact(key="browser.enabled", value=True, source="test"),
-    ]
-    result = engine.evaluate(facts)
-    tool002 = [f for f in result.findings if f.rule_id == "TOOL-002"]
-    assert len(tool002) == 1
-    assert tool002[0].severity == "medium"
-
-
-def test_tool002_does_not_fire_when_browser_disabled():
-    engine = PolicyEngine(POLICY_PATH)
-    facts = [
-        Fact(key="network.bind_address", value="127.0.0.1", source="test"),
-        Fact(key="runtime.auth_enabled", value=True, source="test"),
-        Fact(key="browser.enabled", value=False, source="test"),
-    ]
-    result = engine.evaluate(facts)
-    tool002 = [f for f in result.findings if f.rule_id == "TOOL-002"]
-    assert len(tool002) == 0
-
-
-# --- LOG-001 ---
-
-def test_log001_fires_when_redaction_disabled():
-    engine = PolicyEngine(POLICY_PATH)
-    facts = [
-        Fact(key="network.bind_address", value="127.0.0.1", source="test"),
-        Fact(key="runtime.auth_enabled", value=True, source="test"),
-        Fact(key="logging.redaction_enabled", value=False, source="test"),
-    ]
-    result = engine.evaluate(facts)
-    log001 = [f for f in result.findings if f.rule_id == "LOG-001"]
-    assert len(log001) == 1
-    assert log001[0].severity == "medium"
-
-
-def test_log001_does_not_fire_when_redaction_enabled():
-    engine = PolicyEngine(POLICY_PATH)
-    facts = [
-        Fact(key="network.bind_address", value="127.0.0.1", source="test"),
-        Fact(key="runtime.auth_enabled", value=True, source="test"),
-        Fact(key="logging.redaction_enabled", value=True, source="test"),
-    ]
-    result = engine.evaluate(facts)
-    log001 = [f for f in result.findings if f.rule_id == "LOG-001"]
-    assert len(log001) == 0
-
-
-# --- LOG-002 ---
-
-def test_log002_fires_when_console_redacted_but_files_not():
-    engine = PolicyEngine(POLICY_PATH)
-    facts = [
-        Fact(key="network.bind_address", value="127.0.0.1", source="test"),
-        Fact(key="runtime.auth_enabled", value=True, source="test"),
-        Fact(key="logging.redaction_enabled", value=True, source="test"),
-        Fact(key="logging.file_logs_redacted", value=False, source="test"),
-    ]
-    result = engine.evaluate(facts)
-    log002 = [f for f in result.findings if f.rule_id == "LOG-002"]
-    assert len(log002) == 1
-    assert log002[0].severity == "low"
-
-
-def test_log002_does_not_fire_when_redaction_fully_off():
-    """LOG-002 only fires when console redaction is on but file logs aren't."""
-    engine = PolicyEngine(POLICY_PATH)
-    facts = [
-        Fact(key="network.bind_address", value="127.0.0.1", source="test"),
-        Fact(key="runtime.auth_enabled", value=True, source="test"),
-        Fact(key="logging.redaction_enabled", value=False, source="test"),
-        Fact(key="logging.file_logs_redacted", value=False, source="test"),
-    ]
-    result = engine.evaluate(facts)
-    log002 = [f for f in result.findings if f.rule_id == "LOG-002"]
-    assert len(log002) == 0
-
-
-def test_duplicate_fact_warns_with_sources():
-    engine = PolicyEngine(POLICY_PATH)
-    facts = [
-        Fact(key="network.bind_address", value="127.0.0.1", source="config-a.yaml"),
-        Fact(key="network.bind_address", value="0.0.0.0", source="config-b.yaml"),
-        Fact(key="runtime.auth_enabled", value=False, source="config-b.yaml"),
+        _f("network.bind_address", "127.0.0.1", "config-a.yaml"),
+        _f("network.bind_address", "0.0.0.0", "config-b.yaml"),
+        _f("runtime.auth_enabled", False, "config-b.yaml"),
     ]
     result = engine.evaluate(facts)
 
@@ -395,18 +221,35 @@ def test_duplicate_fact_warns_with_sources():
     assert "2 times" in result.warnings[0]
 
 
+def test_rule_satisfiable_without_facts_still_fires(tmp_path):
+    """An empty composite beside a leaf fires on an empty fact map.
+
+    Such a rule references facts but must not be skipped by the
+    fact-key dispatch index when none of them are collected.
+    """
+    policy = tmp_path / "policy.yaml"
+    policy.write_text(_dump_policy({
+        "rules": [{
+            "id": "EMPTY-ANY", "title": "t", "severity": "low", "confidence": "low",
+            "condition": {"any": [{"all": []}, {"fact": "x", "op": "eq", "value": 1}]},
+        }]
+    }))
+    engine = PolicyEngine(policy)
+    assert "EMPTY-ANY" in engine.evaluate([]).rule_ids
+
+
 # --- validation ---
 
 def test_rejects_policy_missing_rule_keys(tmp_path):
     policy = tmp_path / "bad.yaml"
-    policy.write_text(yaml.dump({"rules": [{"id": "X"}]}))
+    policy.write_text(_dump_policy({"rules": [{"id": "X"}]}))
     with pytest.raises(PolicyLoadError, match="missing keys"):
         PolicyEngine(policy)
 
 
 def test_rejects_policy_with_bad_condition(tmp_path):
     policy = tmp_path / "bad.yaml"
-    policy.write_text(yaml.dump({
+    policy.write_text(_dump_policy({
         "rules": [{
             "id": "X", "title": "x", "severity": "low", "confidence": "low",
             "condition": {"fact": "x", "op": "nope", "value": 1},
@@ -416,6 +259,25 @@ def test_rejects_policy_with_bad_condition(tmp_path):
         PolicyEngine(policy)
 
 
+def test_trusted_load_skips_rule_validation(tmp_path):
+    """trusted=True loads without per-rule validation (bundled policy path)."""
+    policy = tmp_path / "unvalidated.yaml"
+    policy.write_text(_dump_policy({
+        "rules": [{
+            "id": "X", "title": "x", "severity": "low", "confidence": "low",
+            "condition": {"fact": "x", "op": "nope", "value": 1},
+        }]
+    }))
+    with pytest.raises(PolicyLoadError):
+        PolicyEngine(policy)
+    PolicyEngine(policy, trusted=True)  # must not raise
+
+
+def test_bundled_policy_passes_validation():
+    """The bundled policy is loaded trusted at runtime, so validate it here."""
+    PolicyEngine(POLICY_PATH, trusted=False)
+
+
 def test_rejects_non_dict_policy(tmp_path):
     policy = tmp_path / "bad.yaml"
     policy.write_text("just a string")
@@ -4,22 +4,12 @@ Uses mocked stat results for cross-platform compatibility (Unix permission
 bits are not meaningful on Windows).
 """
 import stat
-from pathlib import Path
 from unittest.mock import patch
 
 from clawshield.scanners.openclaw.permissions import FilePermissionsScanner
 
-
-def _write_config(tmp_path: Path, content: str = "server:\n  port: 8080\n") -> Path:
-    config = tmp_path / "config.yaml"
-    config.write_text(content)
-    return config
-
-
-def _write_env(tmp_path: Path, content: str = "FOO=bar\n") -> Path:
-    env = tmp_path / ".env"
-    env.write_text(content)
-    return env
+# The scanner is stateless, so every test can share one instance.
+_SCANNER = FilePermissionsScanner()
 
 
 class _FakeStat:
@@ -34,34 +24,39 @@ def _mock_posix_scan(config_paths, mode_map):
     """
     def fake_get_mode(path):
         if path in mode_map:
-            return mode_map[path]
+            mode = mode_map[path]
+            # Bare permission bits stand for a regular file; tests
+            # exercising other file types pass a full mode with S_IFMT bits.
+            if stat.S_IFMT(mode) == 0:
+                mode |= stat.S_IFREG
+            return mode
         return None
 
     with patch("clawshield.scanners.openclaw.permissions._IS_POSIX", True), \
          patch("clawshield.scanners.openclaw.permissions._get_mode", side_effect=fake_get_mode):
-        return FilePermissionsScanner().scan(config_paths)
+        return _SCANNER.scan(config_paths)
 
 
 # --- Config world-writable ---
 
-def test_config_world_writable(tmp_path):
-    config = _write_config(tmp_path)
+def test_config_world_writable(write_config):
+    config = write_config()
     mode = stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IWOTH  # 0o642
     facts = _mock_posix_scan([config], {config: mode})
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["files.config_world_writable"] is True
 
 
-def test_config_not_world_writable(tmp_path):
-    config = _write_config(tmp_path)
+def test_config_not_world_writable(write_config):
+    config = write_config()
     mode = stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP  # 0o640
     facts = _mock_posix_scan([config], {config: mode})
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["files.config_world_writable"] is False
 
 
-def test_config_safe_600(tmp_path):
-    config = _write_config(tmp_path)
+def test_config_safe_600(write_config):
+    config = write_config()
     mode = stat.S_IRUSR | stat.S_IWUSR  # 0o600
     facts = _mock_posix_scan([config], {config: mode})
     fact_map = {f.key: f.value for f in facts}
@@ -70,9 +65,9 @@ def test_config_safe_600(tmp_path):
 
 # --- .env world-readable ---
 
-def test_env_world_readable(tmp_path):
-    config = _write_config(tmp_path)
-    env = _write_env(tmp_path)
+def test_env_world_readable(write_config, write_env):
+    config = write_config()
+    env = write_env()
     mode_env = stat.S_IRUSR | stat.S_IWUSR | stat.S_IROTH  # 0o604
     mode_config = stat.S_IRUSR | stat.S_IWUSR  # 0o600
     facts = _mock_posix_scan([config], {config: mode_config, env: mode_env})
@@ -81,9 +76,9 @@ def test_env_world_readable(tmp_path):
     assert fact_map["files.env_world_writable"] is False
 
 
-def test_env_world_writable(tmp_path):
-    config = _write_config(tmp_path)
-    env = _write_env(tmp_path)
+def test_env_world_writable(write_config, write_env):
+    config = write_config()
+    env = write_env()
     mode_env = stat.S_IRUSR | stat.S_IWUSR | stat.S_IWOTH  # 0o602
     mode_config = stat.S_IRUSR | stat.S_IWUSR
     facts = _mock_posix_scan([config], {config: mode_config, env: mode_env})
@@ -91,10 +86,10 @@ def test_env_world_writable(tmp_path):
     assert fact_map["files.env_world_writable"] is True
 
 
-def test_env_777(tmp_path):
+def test_env_777(write_config, write_env):
     """chmod 777 triggers both world-readable and world-writable."""
-    config = _write_config(tmp_path)
-    env = _write_env(tmp_path)
+    config = write_config()
+    env = write_env()
     mode_777 = 0o777
     mode_config = stat.S_IRUSR | stat.S_IWUSR
     facts = _mock_posix_scan([config], {config: mode_config, env: mode_777})
@@ -103,9 +98,9 @@ def test_env_777(tmp_path):
     assert fact_map["files.env_world_writable"] is True
 
 
-def test_env_safe_600(tmp_path):
-    config = _write_config(tmp_path)
-    env = _write_env(tmp_path)
+def test_env_safe_600(write_config, write_env):
+    config = write_config()
+    env = write_env()
     mode_safe = stat.S_IRUSR | stat.S_IWUSR  # 0o600
     facts = _mock_posix_scan([config], {config: mode_safe, env: mode_safe})
     fact_map = {f.key: f.value for f in facts}
@@ -115,8 +110,8 @@ def test_env_safe_600(tmp_path):
 
 # --- .env absent ---
 
-def test_env_absent_emits_false(tmp_path):
-    config = _write_config(tmp_path)
+def test_env_absent_emits_false(write_config):
+    config = write_config()
     mode_config = stat.S_IRUSR | stat.S_IWUSR
     facts = _mock_posix_scan([config], {config: mode_config})
     fact_map = {f.key: f.value for f in facts}
@@ -124,13 +119,26 @@ def test_env_absent_emits_false(tmp_path):
     assert fact_map["files.env_world_writable"] is False
 
 
+# --- .env not a regular file ---
+
+def test_env_non_regular_emits_false(tmp_path, write_config):
+    """A world-readable FIFO named .env is not an exposed secrets file."""
+    config = write_config()
+    mode_config = stat.S_IRUSR | stat.S_IWUSR
+    mode_fifo = stat.S_IFIFO | 0o644
+    facts = _mock_posix_scan([config], {config: mode_config, tmp_path / ".env": mode_fifo})
+    fact_map = {f.key: f.value for f in facts}
+    assert fact_map["files.env_world_readable"] is False
+    assert fact_map["files.env_world_writable"] is False
+
+
 # --- Windows (non-POSIX) ---
 
-def test_windows_emits_all_false(tmp_path):
-    config = _write_config(tmp_path)
-    _write_env(tmp_path)
+def test_windows_emits_all_false(write_config, write_env):
+    config = write_config()
+    write_env()
     with patch("clawshield.scanners.openclaw.permissions._IS_POSIX", False):
-        facts = FilePermissionsScanner().scan([config])
+        facts = _SCANNER.scan([config])
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["files.config_world_writable"] is False
     assert fact_map["files.env_world_readable"] is False
@@ -139,9 +147,9 @@ def test_windows_emits_all_false(tmp_path):
 
 # --- Source attribution ---
 
-def test_source_includes_path(tmp_path):
-    config = _write_config(tmp_path)
-    env = _write_env(tmp_path)
+def test_source_includes_path(write_config, write_env):
+    config = write_config()
+    env = write_env()
     mode = stat.S_IRUSR | stat.S_IWUSR
     facts = _mock_posix_scan([config], {config: mode, env: mode})
     for f in facts:
@@ -150,11 +158,11 @@ def test_source_includes_path(tmp_path):
 
 # --- Dedup ---
 
-def test_env_checked_once_per_directory(tmp_path):
-    config_a = _write_config(tmp_path)
+def test_env_checked_once_per_directory(tmp_path, write_config, write_env):
+    config_a = write_config()
     config_b = tmp_path / "config2.yaml"
     config_b.write_text("b: 2\n")
-    _write_env(tmp_path)
+    write_env()
     mode = stat.S_IRUSR | stat.S_IWUSR
     facts = _mock_posix_scan([config_a, config_b], {config_a: mode, config_b: mode, tmp_path / ".env": mode})
     env_readable_facts = [f for f in facts if f.key == "files.env_world_readable"]
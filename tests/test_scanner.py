@@ -1,3 +1,4 @@
+import functools
 from pathlib import Path
 
 from clawshield.scanners.openclaw.config import OpenClawConfigScanner
@@ -5,9 +6,19 @@ from clawshield.scanners.openclaw.config import OpenClawConfigScanner
 FIXTURES = Path(__file__).parent / "fixtures"
 
 
+@functools.cache
+def _scan_fixture(name: str):
+    """Scan a shared fixture file once per session.
+
+    Many tests assert against the same fixture's facts; the scanner is
+    pure for a fixed input, so the parse and extraction run only once.
+    Callers must treat the returned list as read-only.
+    """
+    return OpenClawConfigScanner().scan([FIXTURES / name])
+
+
 def test_scan_vulnerable_config():
-    scanner = OpenClawConfigScanner()
-    facts = scanner.scan([FIXTURES / "openclaw_vulnerable.yaml"])
+    facts = _scan_fixture("openclaw_vulnerable.yaml")
 
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["network.bind_address"] == "0.0.0.0"
@@ -15,8 +26,7 @@ def test_scan_vulnerable_config():
 
 
 def test_scan_safe_config():
-    scanner = OpenClawConfigScanner()
-    facts = scanner.scan([FIXTURES / "openclaw_safe.yaml"])
+    facts = _scan_fixture("openclaw_safe.yaml")
 
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["network.bind_address"] == "127.0.0.1"
@@ -32,8 +42,7 @@ def test_scan_empty_paths():
 # --- normalization ---
 
 def test_normalizes_string_false_to_bool():
-    scanner = OpenClawConfigScanner()
-    facts = scanner.scan([FIXTURES / "openclaw_string_bools.yaml"])
+    facts = _scan_fixture("openclaw_string_bools.yaml")
 
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["runtime.auth_enabled"] is False
@@ -41,8 +50,7 @@ def test_normalizes_string_false_to_bool():
 
 
 def test_normalizes_string_true_to_bool():
-    scanner = OpenClawConfigScanner()
-    facts = scanner.scan([FIXTURES / "openclaw_string_true.yaml"])
+    facts = _scan_fixture("openclaw_string_true.yaml")
 
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["runtime.auth_enabled"] is True
@@ -50,8 +58,7 @@ def test_normalizes_string_true_to_bool():
 
 
 def test_strips_whitespace_from_bind_address():
-    scanner = OpenClawConfigScanner()
-    facts = scanner.scan([FIXTURES / "openclaw_string_bools.yaml"])
+    facts = _scan_fixture("openclaw_string_bools.yaml")
 
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["network.bind_address"] == "0.0.0.0"
@@ -61,8 +68,7 @@ def test_strips_whitespace_from_bind_address():
 # --- JSON config format (openclaw.json) ---
 
 def test_scan_json_vulnerable_config():
-    scanner = OpenClawConfigScanner()
-    facts = scanner.scan([FIXTURES / "openclaw_vulnerable.json"])
+    facts = _scan_fixture("openclaw_vulnerable.json")
 
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["network.bind_address"] == "0.0.0.0"
@@ -76,8 +82,7 @@ def test_scan_json_vulnerable_config():
 
 
 def test_scan_json_safe_config():
-    scanner = OpenClawConfigScanner()
-    facts = scanner.scan([FIXTURES / "openclaw_safe.json"])
+    facts = _scan_fixture("openclaw_safe.json")
 
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["network.bind_address"] == "127.0.0.1"
@@ -88,8 +93,7 @@ def test_scan_json_safe_config():
 
 def test_scan_json_no_auth_section():
     """When gateway exists but auth is missing entirely, treat as auth disabled."""
-    scanner = OpenClawConfigScanner()
-    facts = scanner.scan([FIXTURES / "openclaw_no_auth.json"])
+    facts = _scan_fixture("openclaw_no_auth.json")
 
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["network.bind_address"] == "0.0.0.0"
@@ -99,8 +103,7 @@ def test_scan_json_no_auth_section():
 
 def test_scan_json_loopback_maps_to_localhost():
     """OpenClaw's 'loopback' bind mode should map to 127.0.0.1."""
-    scanner = OpenClawConfigScanner()
-    facts = scanner.scan([FIXTURES / "openclaw_safe.json"])
+    facts = _scan_fixture("openclaw_safe.json")
 
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["network.bind_address"] == "127.0.0.1"
@@ -108,8 +111,7 @@ def test_scan_json_loopback_maps_to_localhost():
 
 def test_scan_json_lan_maps_to_public():
     """OpenClaw's 'lan' bind mode should map to 0.0.0.0 (public exposure)."""
-    scanner = OpenClawConfigScanner()
-    facts = scanner.scan([FIXTURES / "openclaw_vulnerable.json"])
+    facts = _scan_fixture("openclaw_vulnerable.json")
 
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["network.bind_address"] == "0.0.0.0"
@@ -117,8 +119,7 @@ def test_scan_json_lan_maps_to_public():
 
 def test_scan_json_token_auth_is_enabled():
     """Auth mode 'token' should be treated as auth enabled."""
-    scanner = OpenClawConfigScanner()
-    facts = scanner.scan([FIXTURES / "openclaw_safe.json"])
+    facts = _scan_fixture("openclaw_safe.json")
 
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["runtime.auth_enabled"] is True
@@ -126,8 +127,7 @@ def test_scan_json_token_auth_is_enabled():
 
 def test_scan_json_none_auth_is_disabled():
     """Auth mode 'none' should be treated as auth disabled."""
-    scanner = OpenClawConfigScanner()
-    facts = scanner.scan([FIXTURES / "openclaw_vulnerable.json"])
+    facts = _scan_fixture("openclaw_vulnerable.json")
 
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["runtime.auth_enabled"] is False
@@ -137,42 +137,38 @@ def test_scan_json_none_auth_is_disabled():
 
 def test_json_sandbox_defaults_to_disabled():
     """Absent sandbox config → sandbox.enabled=False (documented default)."""
-    scanner = OpenClawConfigScanner()
-    facts = scanner.scan([FIXTURES / "openclaw_safe.json"])
+    facts = _scan_fixture("openclaw_safe.json")
 
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["sandbox.enabled"] is False
     # Source should indicate this was defaulted
-    sandbox_fact = [f for f in facts if f.key == "sandbox.enabled"][0]
+    sandbox_fact = {f.key: f for f in facts}["sandbox.enabled"]
     assert "defaulted" in sandbox_fact.source
 
 
 def test_json_shell_defaults_to_enabled():
     """Absent tools config → full profile → shell enabled (documented default)."""
-    scanner = OpenClawConfigScanner()
-    facts = scanner.scan([FIXTURES / "openclaw_safe.json"])
+    facts = _scan_fixture("openclaw_safe.json")
 
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["tools.shell_enabled"] is True
-    shell_fact = [f for f in facts if f.key == "tools.shell_enabled"][0]
+    shell_fact = {f.key: f for f in facts}["tools.shell_enabled"]
     assert "defaulted" in shell_fact.source
 
 
 def test_json_browser_defaults_to_enabled():
     """Absent browser config → browser.enabled=True (documented default)."""
-    scanner = OpenClawConfigScanner()
-    facts = scanner.scan([FIXTURES / "openclaw_safe.json"])
+    facts = _scan_fixture("openclaw_safe.json")
 
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["browser.enabled"] is True
-    browser_fact = [f for f in facts if f.key == "browser.enabled"][0]
+    browser_fact = {f.key: f for f in facts}["browser.enabled"]
     assert "defaulted" in browser_fact.source
 
 
 def test_json_redaction_defaults_to_enabled():
     """Absent logging config → redaction enabled (documented default: 'tools')."""
-    scanner = OpenClawConfigScanner()
-    facts = scanner.scan([FIXTURES / "openclaw_safe.json"])
+    facts = _scan_fixture("openclaw_safe.json")
 
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["logging.redaction_enabled"] is True
@@ -181,10 +177,9 @@ def test_json_redaction_defaults_to_enabled():
 
 def test_json_file_logs_tagged_as_documented():
     """File log redaction fact should cite documented behavior."""
-    scanner = OpenClawConfigScanner()
-    facts = scanner.scan([FIXTURES / "openclaw_safe.json"])
+    facts = _scan_fixture("openclaw_safe.json")
 
-    log_fact = [f for f in facts if f.key == "logging.file_logs_redacted"][0]
+    log_fact = {f.key: f for f in facts}["logging.file_logs_redacted"]
     assert "documented behavior" in log_fact.source
 
 
@@ -198,7 +193,7 @@ def test_json_explicit_sandbox_enabled(tmp_path):
 
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["sandbox.enabled"] is True
-    sandbox_fact = [f for f in facts if f.key == "sandbox.enabled"][0]
+    sandbox_fact = {f.key: f for f in facts}["sandbox.enabled"]
     assert "defaulted" not in sandbox_fact.source
 
 
@@ -228,8 +223,7 @@ def test_json_tools_deny_disables_browser(tmp_path):
 
 def test_json_strong_token_not_weak():
     """A 48-char hex token should not be flagged as weak."""
-    scanner = OpenClawConfigScanner()
-    facts = scanner.scan([FIXTURES / "openclaw_safe.json"])
+    facts = _scan_fixture("openclaw_safe.json")
 
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["runtime.auth_token_weak"] is False
@@ -284,7 +278,7 @@ def test_commands_bash_false_disables_shell(tmp_path):
 
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["tools.shell_enabled"] is False
-    shell_fact = [f for f in facts if f.key == "tools.shell_enabled"][0]
+    shell_fact = {f.key: f for f in facts}["tools.shell_enabled"]
     assert "defaulted" not in shell_fact.source
 
 
@@ -298,7 +292,7 @@ def test_commands_bash_true_enables_shell(tmp_path):
 
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["tools.shell_enabled"] is True
-    shell_fact = [f for f in facts if f.key == "tools.shell_enabled"][0]
+    shell_fact = {f.key: f for f in facts}["tools.shell_enabled"]
     assert "defaulted" not in shell_fact.source
 
 
@@ -324,7 +318,7 @@ def test_no_commands_bash_defaults_to_shell_enabled(tmp_path):
 
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["tools.shell_enabled"] is True
-    shell_fact = [f for f in facts if f.key == "tools.shell_enabled"][0]
+    shell_fact = {f.key: f for f in facts}["tools.shell_enabled"]
     assert "defaulted" in shell_fact.source
 
 
@@ -338,7 +332,7 @@ def test_no_commands_bash_with_profile_full(tmp_path):
 
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["tools.shell_enabled"] is True
-    shell_fact = [f for f in facts if f.key == "tools.shell_enabled"][0]
+    shell_fact = {f.key: f for f in facts}["tools.shell_enabled"]
     assert "defaulted" not in shell_fact.source
 
 
@@ -1,34 +1,73 @@
 """Tests for SecretsLiteScanner."""
-from pathlib import Path
+import os
+from unittest.mock import patch
+
+import pytest
 
 from clawshield.scanners.openclaw.secrets import SecretsLiteScanner
 
+# The scanner is stateless, so every test can share one instance.
+_SCANNER = SecretsLiteScanner()
+
 
-def _write_config(tmp_path: Path, content: str) -> Path:
-    config = tmp_path / "config.yaml"
-    config.write_text(content)
-    return config
+@pytest.fixture(scope="session")
+def scan_cached(tmp_path_factory):
+    """Scan a (config, env) content pair once per session.
 
+    Most tests here probe the same few content combinations; the scanner
+    is pure for fixed inputs, so each combination is materialized and
+    scanned once. env_content=None means no .env file is written.
+    """
+    cache = {}
 
-def _write_env(tmp_path: Path, content: str) -> Path:
-    env = tmp_path / ".env"
-    env.write_text(content)
-    return env
+    def _scan(config_content="server:\n  port: 8080\n", env_content=None):
+        key = (config_content, env_content)
+        if key not in cache:
+            config_dir = tmp_path_factory.mktemp("secrets")
+            config = config_dir / "config.yaml"
+            config.write_text(config_content)
+            if env_content is not None:
+                (config_dir / ".env").write_text(env_content)
+            cache[key] = _SCANNER.scan([config])
+        return cache[key]
+
+    return _scan
 
 
 # --- .env detection ---
 
-def test_env_file_present(tmp_path):
-    config = _write_config(tmp_path, "server:\n  port: 8080\n")
-    _write_env(tmp_path, "FOO=bar\n")
-    facts = SecretsLiteScanner().scan([config])
+def test_env_file_present(scan_cached):
+    facts = scan_cached(env_content="FOO=bar\n")
+    fact_map = {f.key: f.value for f in facts}
+    assert fact_map["secrets.env_file_present"] is True
+
+
+def test_env_unreadable_still_reported_present(write_config, write_env):
+    """A .env that exists but can't be read must not be reported as absent."""
+    config = write_config()
+    write_env("OPENAI_API_KEY=sk-abc\n")
+    with patch("pathlib.Path.open", side_effect=PermissionError):
+        facts = _SCANNER.scan([config])
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["secrets.env_file_present"] is True
+    # Contents are unreadable, so no key evidence can be reported
+    assert fact_map["secrets.api_key_in_env_file"] is False
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires os.mkfifo")
+def test_env_fifo_treated_as_absent(tmp_path, write_config):
+    """A non-regular .env (here a FIFO) must never be opened: reading a
+    FIFO with no writer blocks forever. It reads as absent instead."""
+    config = write_config()
+    os.mkfifo(tmp_path / ".env")
+    facts = _SCANNER.scan([config])
+    fact_map = {f.key: f.value for f in facts}
+    assert fact_map["secrets.env_file_present"] is False
+    assert fact_map["secrets.api_key_in_env_file"] is False
 
 
-def test_env_file_absent(tmp_path):
-    config = _write_config(tmp_path, "server:\n  port: 8080\n")
-    facts = SecretsLiteScanner().scan([config])
+def test_env_file_absent(scan_cached):
+    facts = scan_cached()
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["secrets.env_file_present"] is False
     # Always emitted, False when .env doesn't exist
@@ -37,57 +76,46 @@ def test_env_file_absent(tmp_path):
 
 # --- .env with API keys ---
 
-def test_env_with_openai_key(tmp_path):
-    config = _write_config(tmp_path, "server:\n  port: 8080\n")
-    _write_env(tmp_path, "OPENAI_API_KEY=sk-abc123\n")
-    facts = SecretsLiteScanner().scan([config])
+def test_env_with_openai_key(scan_cached):
+    facts = scan_cached(env_content="OPENAI_API_KEY=sk-abc123\n")
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["secrets.api_key_in_env_file"] is True
 
 
-def test_env_with_anthropic_key(tmp_path):
-    config = _write_config(tmp_path, "server:\n  port: 8080\n")
-    _write_env(tmp_path, "ANTHROPIC_API_KEY=sk-ant-xyz\n")
-    facts = SecretsLiteScanner().scan([config])
+def test_env_with_anthropic_key(scan_cached):
+    facts = scan_cached(env_content="ANTHROPIC_API_KEY=sk-ant-xyz\n")
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["secrets.api_key_in_env_file"] is True
 
 
-def test_env_with_no_known_keys(tmp_path):
-    config = _write_config(tmp_path, "server:\n  port: 8080\n")
-    _write_env(tmp_path, "DATABASE_URL=postgres://localhost/db\nDEBUG=true\n")
-    facts = SecretsLiteScanner().scan([config])
+def test_env_with_no_known_keys(scan_cached):
+    facts = scan_cached(env_content="DATABASE_URL=postgres://localhost/db\nDEBUG=true\n")
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["secrets.api_key_in_env_file"] is False
 
 
-def test_env_comments_and_blanks_ignored(tmp_path):
-    config = _write_config(tmp_path, "server:\n  port: 8080\n")
-    _write_env(tmp_path, "# OPENAI_API_KEY=sk-old\n\n  \nDEBUG=true\n")
-    facts = SecretsLiteScanner().scan([config])
+def test_env_comments_and_blanks_ignored(scan_cached):
+    facts = scan_cached(env_content="# OPENAI_API_KEY=sk-old\n\n  \nDEBUG=true\n")
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["secrets.api_key_in_env_file"] is False
 
 
 # --- Config file with API key names ---
 
-def test_config_with_api_key_reference(tmp_path):
-    config = _write_config(tmp_path, "llm:\n  api_key_env: OPENAI_API_KEY\n")
-    facts = SecretsLiteScanner().scan([config])
+def test_config_with_api_key_reference(scan_cached):
+    facts = scan_cached("llm:\n  api_key_env: OPENAI_API_KEY\n")
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["secrets.api_key_in_config"] is True
 
 
-def test_config_without_api_key_reference(tmp_path):
-    config = _write_config(tmp_path, "server:\n  port: 8080\n")
-    facts = SecretsLiteScanner().scan([config])
+def test_config_without_api_key_reference(scan_cached):
+    facts = scan_cached()
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["secrets.api_key_in_config"] is False
 
 
-def test_config_case_insensitive_match(tmp_path):
-    config = _write_config(tmp_path, "key: openai_api_key\n")
-    facts = SecretsLiteScanner().scan([config])
+def test_config_case_insensitive_match(scan_cached):
+    facts = scan_cached("key: openai_api_key\n")
     fact_map = {f.key: f.value for f in facts}
     assert fact_map["secrets.api_key_in_config"] is True
 
@@ -108,30 +136,28 @@ def test_multiple_configs_different_dirs(tmp_path):
     config_b.write_text("server:\n  port: 9090\n")
     # No .env in dir_b
 
-    facts = SecretsLiteScanner().scan([config_a, config_b])
+    facts = _SCANNER.scan([config_a, config_b])
     env_key_facts = [f for f in facts if f.key == "secrets.api_key_in_env_file"]
     # Both dirs emit the fact; dir_a has key, dir_b doesn't
     assert len(env_key_facts) == 2
     assert any(f.value is True for f in env_key_facts)
 
 
-def test_env_checked_once_per_directory(tmp_path):
+def test_env_checked_once_per_directory(tmp_path, write_config, write_env):
     """Two configs in the same dir should only produce one env_file_present fact."""
-    config_a = _write_config(tmp_path, "a: 1\n")
+    config_a = write_config("a: 1\n")
     config_b = tmp_path / "config2.yaml"
     config_b.write_text("b: 2\n")
-    _write_env(tmp_path, "FOO=bar\n")
+    write_env()
 
-    facts = SecretsLiteScanner().scan([config_a, config_b])
+    facts = _SCANNER.scan([config_a, config_b])
     env_present_facts = [f for f in facts if f.key == "secrets.env_file_present"]
     assert len(env_present_facts) == 1
 
 
 # --- Source attribution ---
 
-def test_source_includes_file_path(tmp_path):
-    config = _write_config(tmp_path, "server:\n  port: 8080\n")
-    _write_env(tmp_path, "OPENAI_API_KEY=sk-abc\n")
-    facts = SecretsLiteScanner().scan([config])
+def test_source_includes_file_path(scan_cached):
+    facts = scan_cached(env_content="OPENAI_API_KEY=sk-abc\n")
     for f in facts:
         assert f.source.startswith("secrets_lite:")
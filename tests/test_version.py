@@ -4,17 +4,24 @@ from pathlib import Path
 import clawshield
 
 
-def test_version_matches_pyproject():
+def _pyproject_version() -> str:
+    # version sits near the top of [project]; stream lines and stop at
+    # the first hit instead of materializing the whole file as a list.
     pyproject = Path(__file__).parent.parent / "pyproject.toml"
-    for line in pyproject.read_text().splitlines():
-        if line.strip().startswith("version"):
-            # Extract version string from: version = "0.3.0"
-            pyproject_version = line.split("=", 1)[1].strip().strip('"')
-            break
-    else:
-        raise AssertionError("No version found in pyproject.toml")
+    with pyproject.open(encoding="utf-8") as fh:
+        for line in fh:
+            stripped = line.lstrip()
+            if stripped.startswith("version"):
+                # Extract version string from: version = "0.3.0"
+                return stripped.partition("=")[2].strip().strip('"')
+    raise AssertionError("No version found in pyproject.toml")
+
+
+PYPROJECT_VERSION = _pyproject_version()
 
-    assert clawshield.__version__ == pyproject_version, (
+
+def test_version_matches_pyproject():
+    assert clawshield.__version__ == PYPROJECT_VERSION, (
         f"Version mismatch: clawshield/__init__.py has {clawshield.__version__!r}, "
-        f"pyproject.toml has {pyproject_version!r}"
+        f"pyproject.toml has {PYPROJECT_VERSION!r}"
     )